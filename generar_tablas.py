@@ -0,0 +1,21 @@
+"""Genera assets/tablas.bin con las tablas Z, t, χ² y F precalculadas.
+
+Uso: python generar_tablas.py
+La app lo abre con mmap (ver TablasCriticas); volver a correrlo solo hace
+falta si cambian los rangos de las tablas o los algoritmos de cálculo.
+"""
+import os
+
+from statistics_logic import TablasCriticas
+
+
+def main():
+    datos = TablasCriticas.serializar(TablasCriticas.construir())
+    os.makedirs(os.path.dirname(TablasCriticas.RUTA), exist_ok=True)
+    with open(TablasCriticas.RUTA, "wb") as f:
+        f.write(datos)
+    print(f"{TablasCriticas.RUTA}: {len(datos)} bytes")
+
+
+if __name__ == "__main__":
+    main()
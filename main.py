@@ -1,5 +1,9 @@
+import math
+import threading
+
 import flet as ft
-from statistics_logic import EstadisticaPura
+from statistics_logic import (EstadisticaPura, CacheLRU, TablasCriticas, GestorGraficos, MotorSimulacion,
+                               HistogramaFijo, ResumenSimulacion, SesionDescriptiva, ImportadorDatos)
 
 # ==========================================
 # 1. LÓGICA DE NEGOCIO (Wrapper)
@@ -18,44 +22,54 @@ class EstadisticaLogic:
         "fisher_f": {"nombre": "Fisher F", "params": [("gl numerador (d₁)", "5"), ("gl denominador (d₂)", "10")]},
     }
 
+    # Un chart por distribución; cambiar parámetros solo reemplaza sus datos
+    graficos = GestorGraficos()
+
     @staticmethod
-    def generar_grafico(dist_id, params):
-        """Genera el control gráfico Flet directamente"""
+    def generar_grafico(dist_id, params, max_barras):
+        """Devuelve el control gráfico Flet de la distribución"""
         try:
-            chart = EstadisticaPura.generar_grafico_dispatch(dist_id, params)
+            chart = EstadisticaLogic.graficos.obtener(dist_id, params, max_barras)
             title = EstadisticaLogic.DISTRIBUCIONES[dist_id]["nombre"]
             return chart, title
         except Exception as e:
             return ft.Text(f"Error gráfico: {e}"), "Error"
 
+    # Consultas repetidas ("Buscar Probabilidad" / "Buscar Dato") salen de caché
+    cache_probabilidad = CacheLRU(256)
+    cache_dato = CacheLRU(256)
+
+    @staticmethod
+    def configurar_cache(capacidad):
+        """Cambia el tamaño máximo de ambas cachés"""
+        EstadisticaLogic.cache_probabilidad.redimensionar(capacidad)
+        EstadisticaLogic.cache_dato.redimensionar(capacidad)
+
     @staticmethod
     def calcular_probabilidad(dist_id, params, valor):
         """Calcula P(X <= valor)"""
+        cache = EstadisticaLogic.cache_probabilidad
+        return cache.obtener_o_calcular(
+            cache.clave(dist_id, params, valor),
+            lambda: EstadisticaLogic._calcular_probabilidad(dist_id, params, valor)
+        )
+
+    @staticmethod
+    def _calcular_probabilidad(dist_id, params, valor):
         try:
             if dist_id == "normal":
                 return EstadisticaPura.normal_cdf(valor, params[0], params[1])
             elif dist_id == "exponencial":
                 return EstadisticaPura.exponential_cdf(valor, params[0])
             elif dist_id == "poisson":
-                # Poisson CDF sumando PMFs (simple)
-                lambd = params[0]
-                k = int(valor)
-                return sum(EstadisticaPura.poisson_pmf(i, lambd) for i in range(k + 1))
+                return EstadisticaPura.poisson_cdf(valor, params[0])
             elif dist_id == "binomial":
                 n, p = params
-                k = int(valor)
-                return sum(EstadisticaPura.binomial_pmf(i, n, p) for i in range(k + 1))
+                return EstadisticaPura.binomial_cdf(valor, n, p)
             elif dist_id == "t_student":
                 return EstadisticaPura.t_cdf(valor, params[0])
             elif dist_id == "chi_cuadrado":
-                # Chi2 CDF via integration
-                prob = 0.0
-                dt = 0.1
-                t = 0.0
-                while t < valor:
-                    prob += EstadisticaPura.chi2_pdf(t, params[0]) * dt
-                    t += dt
-                return min(max(prob, 0), 1)
+                return EstadisticaPura.chi2_cdf(valor, params[0])
             elif dist_id == "fisher_f":
                 return EstadisticaPura.f_cdf(valor, params[0], params[1])
             # Chi2 y uniforme no implementados en simple pure logic full cdf yet for "calcular_probabilidad" exactly as scipy
@@ -67,6 +81,14 @@ class EstadisticaLogic:
     @staticmethod
     def calcular_dato(dist_id, params, probabilidad):
         """Calcula el valor X tal que P(X <= x) = probabilidad"""
+        cache = EstadisticaLogic.cache_dato
+        return cache.obtener_o_calcular(
+            cache.clave(dist_id, params, probabilidad),
+            lambda: EstadisticaLogic._calcular_dato(dist_id, params, probabilidad)
+        )
+
+    @staticmethod
+    def _calcular_dato(dist_id, params, probabilidad):
         try:
             if dist_id == "normal":
                 return EstadisticaPura.normal_ppf(probabilidad, params[0], params[1])
@@ -80,40 +102,45 @@ class EstadisticaLogic:
         except Exception as e:
             return f"Error: {e}"
 
+    # Máximo de valores por simulación (los bloques mantienen acotada la memoria)
+    limite_simulacion = 10_000_000
+
+    # Procesos para simulaciones grandes: 1 = todo en este proceso, que es lo
+    # seguro en la app (Android/APK). configurar_procesos_simulacion lo sube en
+    # servidores; el resultado con una misma semilla no cambia
+    procesos_simulacion = 1
+
+    # Error de rango de los cuantiles aproximados (t-digest) de la simulación
+    # y de la Calculadora con muchos datos
+    precision_cuantiles = 0.005
+
     @staticmethod
-    def simular(dist_id, params, n):
-        """Genera n valores aleatorios"""
+    def configurar_limite_simulacion(limite):
+        EstadisticaLogic.limite_simulacion = int(limite)
+
+    @staticmethod
+    def configurar_precision_cuantiles(precision):
+        EstadisticaLogic.precision_cuantiles = float(precision)
+
+    @staticmethod
+    def configurar_procesos_simulacion(procesos):
+        EstadisticaLogic.procesos_simulacion = max(1, int(procesos))
+
+    @staticmethod
+    def simular(dist_id, params, n, semilla=None):
+        """Genera n valores aleatorios como un iterador de bloques array('d')"""
         if n <= 0:
-            return ["Error: N debe ser mayor que 0"]
-        if n > 10000:
-            n = 10000  # Limitar para evitar problemas de rendimiento
+            return "Error: N debe ser mayor que 0"
+        if n > EstadisticaLogic.limite_simulacion:
+            return f"Error: N no puede superar {EstadisticaLogic.limite_simulacion:,}"
         
-        results = []
         try:
-            import random
-            for _ in range(n):
-                if dist_id == "normal":
-                    results.append(random.gauss(params[0], params[1]))
-                elif dist_id == "exponencial":
-                    results.append(random.expovariate(params[0]))
-                elif dist_id == "poisson":
-                    # Simple poisson generator or use math logic
-                    L = 2.71828 ** (-params[0])
-                    k = 0
-                    p = 1
-                    while p > L:
-                        k += 1
-                        p *= random.random()
-                    results.append(k - 1)
-                elif dist_id == "uniforme":
-                    results.append(random.uniform(params[0], params[1]))
-                else:
-                    results.append(0.0)
-            return results
+            return MotorSimulacion(dist_id, params, semilla,
+                                   procesos=EstadisticaLogic.procesos_simulacion).bloques(n)
         except ValueError as e:
-            return [f"Error de valor: {e}"]
+            return f"Error de valor: {e}"
         except Exception as e:
-            return [f"Error: {e}"]
+            return f"Error: {e}"
 
 
 # ==========================================
@@ -188,7 +215,7 @@ def main(page: ft.Page):
             height=55
         )
 
-    # --- Sección Fórmula (reemplaza gráfico) ---
+    # --- Sección Fórmula ---
     formula_titulo = ft.Text("FÓRMULA", size=12, weight=ft.FontWeight.W_500, color=TEXT_MUTED)
     formula_texto = ft.Text("", size=14, color="#ffffff", selectable=True)
     formula_con_valores = ft.Text("", size=14, color=ACCENT_GREEN, weight=ft.FontWeight.BOLD, selectable=True)
@@ -208,6 +235,37 @@ def main(page: ft.Page):
         visible=False
     )
 
+    # --- Sección Gráfico ---
+    # El chart lo da EstadisticaLogic.graficos: uno por distribución, y al
+    # cambiar parámetros solo se reemplazan sus datos
+    grafico_titulo = ft.Text("GRÁFICO", size=12, weight=ft.FontWeight.W_500, color=TEXT_MUTED)
+    grafico_area = ft.Container(height=200)
+    # Antes de conectarse la página no tiene ancho; se supone un móvil
+    ANCHO_PAGINA_PREDETERMINADO = 400
+
+    seccion_grafico = ft.Container(
+        content=ft.Column([
+            grafico_titulo,
+            ft.Container(height=8),
+            grafico_area
+        ]),
+        bgcolor=CARD_BG,
+        border_radius=12,
+        padding=15,
+        margin=ft.Margin(0, 0, 0, 12),
+        visible=False
+    )
+
+    def mostrar_grafico(dist_id, params):
+        """Dibuja la densidad (o PMF) de la distribución con estos parámetros"""
+        # Ancho útil del chart: la página menos el padding de la vista y de la card
+        ancho = (page.width or ANCHO_PAGINA_PREDETERMINADO) - 2 * 16 - 2 * 15
+        max_barras = max(1, int(ancho // EstadisticaPura.ANCHO_MIN_BARRA))
+        chart, titulo = EstadisticaLogic.generar_grafico(dist_id, params, max_barras)
+        grafico_titulo.value = f"GRÁFICO · {titulo}"
+        grafico_area.content = chart
+        seccion_grafico.visible = True
+
     # Fórmulas por distribución
     FORMULAS = {
         "normal": {
@@ -324,6 +382,7 @@ def main(page: ft.Page):
         
         # Mostrar fórmula de la distribución
         mostrar_formula(dist_id, params_valores)
+        mostrar_grafico(dist_id, params_valores)
         
         if page.controls:  # Solo actualizar si la página ya tiene controles
             page.update()
@@ -377,6 +436,9 @@ def main(page: ft.Page):
         visible=False
     )
 
+    # Las muestras crudas solo se guardan si se piden
+    check_guardar_muestras = ft.Checkbox(label="Conservar muestras", value=False)
+
     # Contenedor para campos dinámicos
     campos_dinamicos = ft.Container(
         content=ft.Row([input_valor], spacing=12),
@@ -407,7 +469,10 @@ def main(page: ft.Page):
             input_valor.visible = False
             input_n.label = "Cantidad (N)"
             input_n.visible = True
-            campos_dinamicos.content = ft.Row([input_n], spacing=12)
+            campos_dinamicos.content = ft.Column([
+                ft.Row([input_n], spacing=12),
+                check_guardar_muestras
+            ], spacing=4)
         page.update()
 
     radio_operacion = ft.RadioGroup(
@@ -441,10 +506,54 @@ def main(page: ft.Page):
         resultado_container.visible = True
         page.update()
 
-    def mostrar_resultado_simulacion(datos):
-        """Muestra resultados de simulación como chips"""
-        # Limitar a 20 chips para no sobrecargar la UI
-        datos_mostrar = datos[:20] if len(datos) > 20 else datos
+    # Último resumen de simulación (con sus muestras, si se conservaron)
+    simulacion_actual = {"resumen": None}
+
+    def crear_histograma(histograma, alto=120):
+        """Barras del histograma como Containers alineados abajo"""
+        maximo = max(histograma.conteos) or 1
+        bordes = histograma.bordes()
+        barras = ft.Row(
+            controls=[
+                ft.Container(
+                    height=max(1, alto * c / maximo),
+                    expand=True,
+                    bgcolor=ACCENT_GREEN,
+                    border_radius=2,
+                    tooltip=f"[{bordes[i]:.3g}, {bordes[i + 1]:.3g}): {c}"
+                ) for i, c in enumerate(histograma.conteos)
+            ],
+            spacing=1,
+            height=alto,
+            vertical_alignment=ft.CrossAxisAlignment.END
+        )
+        controles = [
+            barras,
+            ft.Row([
+                ft.Text(f"{bordes[0]:.4g}", size=10, color=TEXT_MUTED),
+                ft.Text(f"{bordes[-1]:.4g}", size=10, color=TEXT_MUTED),
+            ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN)
+        ]
+        # Los bordes son fijos: lo que cae afuera se informa, no se pierde
+        if histograma.debajo or histograma.encima:
+            total = histograma.total
+            controles.append(ft.Text(
+                f"Fuera del gráfico: {histograma.debajo:,} debajo de {bordes[0]:.4g} "
+                f"({histograma.debajo / total:.2%}) y {histograma.encima:,} encima de {bordes[-1]:.4g} "
+                f"({histograma.encima / total:.2%})",
+                size=11, color="#f59e0b"
+            ))
+        return ft.Column(controles, spacing=4)
+
+    def mostrar_resultado_simulacion(bloques):
+        """Muestra el resumen en línea de la simulación: estadísticos, histograma y primeros valores"""
+        resumen = ResumenSimulacion(
+            guardar_muestras=check_guardar_muestras.value,
+            precision_cuantiles=EstadisticaLogic.precision_cuantiles
+        ).consumir(bloques)
+        simulacion_actual["resumen"] = resumen
+        total = resumen.n
+        datos_mostrar = resumen.primeros
         chips = ft.Row(
             controls=[
                 ft.Container(
@@ -458,12 +567,36 @@ def main(page: ft.Page):
             spacing=8,
             run_spacing=8
         )
-        extra_text = f" (mostrando 20 de {len(datos)})" if len(datos) > 20 else ""
+        filas = [
+            ("Media", resumen.media), ("Desv. estándar", resumen.desviacion),
+            ("Mínimo", resumen.minimo), ("Máximo", resumen.maximo),
+            ("Q1", resumen.cuantil(0.25)), ("Mediana", resumen.cuantil(0.5)), ("Q3", resumen.cuantil(0.75)),
+        ]
+        estadisticos = ft.Row(
+            controls=[
+                ft.Column([
+                    ft.Text(nombre, size=11, color=TEXT_MUTED),
+                    ft.Text(f"{valor:.4f}", size=13, weight=ft.FontWeight.BOLD, color="#ffffff")
+                ], spacing=2) for nombre, valor in filas
+            ],
+            wrap=True,
+            spacing=16,
+            run_spacing=8
+        )
+        extra_text = f" (mostrando 20 de {total})" if total > 20 else ""
+        guardadas = (f"{len(resumen.muestras):,} muestras conservadas en memoria"
+                     if resumen.muestras is not None else "Muestras no conservadas")
         resultado_container.content = crear_card(
             ft.Column([
-                ft.Text(f"Resultados de Simulación ({len(datos)}){extra_text}:", size=12, color=TEXT_MUTED),
+                ft.Text(f"Resultados de Simulación ({total}):", size=12, color=TEXT_MUTED),
                 ft.Container(height=8),
-                chips
+                estadisticos,
+                ft.Container(height=12),
+                crear_histograma(resumen.histograma),
+                ft.Container(height=12),
+                ft.Text(f"Primeros valores{extra_text}:", size=12, color=TEXT_MUTED),
+                chips,
+                ft.Text(guardadas, size=11, color=TEXT_MUTED)
             ])
         )
         resultado_container.visible = True
@@ -477,6 +610,7 @@ def main(page: ft.Page):
             
             # Obtener valores de los parámetros
             params = [float(field.value) for field in param_fields]
+            mostrar_grafico(dist_id, params)
 
             if op == "prob":
                 val = float(input_valor.value)
@@ -599,8 +733,11 @@ def main(page: ft.Page):
                     mostrar_resultado_simple("Media muestral solo disponible para Distribución Normal")
             elif op == "sim":
                 n = int(input_n.value)
-                datos = EstadisticaLogic.simular(dist_id, params, n)
-                mostrar_resultado_simulacion(list(datos))
+                bloques = EstadisticaLogic.simular(dist_id, params, n)
+                if isinstance(bloques, str):
+                    mostrar_resultado_simple(bloques)
+                else:
+                    mostrar_resultado_simulacion(bloques)
         except Exception as ex:
             mostrar_resultado_simple(f"Error: {ex}")
 
@@ -633,6 +770,7 @@ def main(page: ft.Page):
                     seccion_distribucion,
                     seccion_parametros,
                     seccion_formula,
+                    seccion_grafico,
                     seccion_operacion,
                     btn_calcular,
                     resultado_container
@@ -662,173 +800,49 @@ def main(page: ft.Page):
     # Contenedor para la tabla seleccionada
     tabla_container = ft.Container(expand=True)
     
-    def generar_tabla_z(highlight_z=None):
-        """Genera la tabla Z (distribución normal estándar)"""
-        columnas = [
-            ft.DataColumn(ft.Text("Z", weight=ft.FontWeight.BOLD, color=TEXT_MUTED, size=12))
-        ]
-        for i in range(10):
-            columnas.append(
-                ft.DataColumn(ft.Text(f".0{i}", weight=ft.FontWeight.BOLD, color=TEXT_MUTED, size=12))
-            )
-        
-        filas = []
-        for z_int in range(0, 40):  # Z de 0.0 a 3.9
-            z_base = z_int / 10
-            celdas = []
-            
-            # Determinar si esta fila debe resaltarse
-            highlight_row = False
-            if highlight_z is not None:
-                try:
-                    hz = float(highlight_z)
-                    if abs(z_base - (hz - (hz % 0.1))) < 0.01:
-                        highlight_row = True
-                except:
-                    pass
-            
-            # Primera celda: valor Z base
-            celdas.append(ft.DataCell(
-                ft.Text(f"{z_base:.1f}", weight=ft.FontWeight.BOLD, 
-                       color=ACCENT_GREEN if highlight_row else "#ffffff", size=12)
-            ))
-            
-            # Celdas de valores
-            for decimal in range(10):
-                z = z_base + decimal / 100
-                prob = EstadisticaPura.normal_cdf(z, 0, 1)
-                
-                # Verificar si esta celda específica debe resaltarse
-                cell_highlight = False
-                if highlight_z is not None:
-                    try:
-                        hz = float(highlight_z)
-                        if abs(z - hz) < 0.001:
-                            cell_highlight = True
-                    except:
-                        pass
-                
-                celdas.append(ft.DataCell(
-                    ft.Text(f"{prob:.4f}", 
-                           color=ACCENT_GREEN if cell_highlight else ("#c9d1d9" if not highlight_row else "#a5d6a7"),
-                           weight=ft.FontWeight.BOLD if cell_highlight else ft.FontWeight.NORMAL,
-                           size=12)
-                ))
-            
-            filas.append(ft.DataRow(cells=celdas))
-        
-        return ft.DataTable(
-            columns=columnas,
-            rows=filas,
-            border=ft.Border.all(1, "#30363d"),
-            border_radius=8,
-            vertical_lines=ft.BorderSide(1, "#30363d"),
-            horizontal_lines=ft.BorderSide(1, "#30363d"),
-            heading_row_color="#1f2937",
-            data_row_color={"hovered": "#21262d"},
-            column_spacing=20
-        )
+    # Valores precalculados (assets/tablas.bin vía mmap): dibujar es solo leer
+    tablas = TablasCriticas.cargar()
     
-    def generar_tabla_t(highlight_df=None):
-        """Genera la tabla t-Student con valores críticos"""
-        # Niveles de significancia comunes (dos colas)
-        alphas = [0.10, 0.05, 0.025, 0.01, 0.005]
-        
-        columnas = [
-            ft.DataColumn(ft.Text("df", weight=ft.FontWeight.BOLD, color=TEXT_MUTED, size=12))
-        ]
-        for alpha in alphas:
-            columnas.append(
-                ft.DataColumn(ft.Text(f"α={alpha}", weight=ft.FontWeight.BOLD, color=TEXT_MUTED, size=11))
-            )
-        
-        filas = []
-        dfs = list(range(1, 31)) + [40, 50, 60, 80, 100, 120]
-        
-        for df in dfs:
-            celdas = []
-            
-            # Determinar si esta fila debe resaltarse
-            highlight_row = False
-            if highlight_df is not None:
-                try:
-                    hdf = int(float(highlight_df))
-                    if df == hdf:
-                        highlight_row = True
-                except:
-                    pass
-            
-            celdas.append(ft.DataCell(
-                ft.Text(str(df), weight=ft.FontWeight.BOLD, 
-                       color=ACCENT_GREEN if highlight_row else "#ffffff", size=12)
-            ))
-            
-            for alpha in alphas:
-                # Valor crítico t para dos colas
-                t_crit = EstadisticaPura.t_ppf(1 - alpha/2, df)
-                celdas.append(ft.DataCell(
-                    ft.Text(f"{t_crit:.4f}", 
-                           color=ACCENT_GREEN if highlight_row else "#c9d1d9", size=12)
-                ))
-            
-            filas.append(ft.DataRow(cells=celdas))
-        
-        return ft.DataTable(
-            columns=columnas,
-            rows=filas,
-            border=ft.Border.all(1, "#30363d"),
-            border_radius=8,
-            vertical_lines=ft.BorderSide(1, "#30363d"),
-            horizontal_lines=ft.BorderSide(1, "#30363d"),
-            heading_row_color="#1f2937",
-            data_row_color={"hovered": "#21262d"},
-            column_spacing=25
-        )
+    # Solo se materializan las filas de la página visible; los mismos
+    # controles se reutilizan al cambiar de página
+    FILAS_POR_PAGINA = 15
+    ALTO_FILA = 40
+    
+    FORMATO_TABLAS = {
+        "z": {"titulo": "Z", "encabezado": lambda c: f".0{int(round(c * 100))}", "size_encabezado": 12,
+              "etiqueta": lambda v: f"{v:.1f}", "decimales": 4, "size": 12, "spacing": 20},
+        "t": {"titulo": "df", "encabezado": lambda c: f"α={c}", "size_encabezado": 11,
+              "etiqueta": lambda v: str(int(v)), "decimales": 4, "size": 12, "spacing": 25},
+        "chi2": {"titulo": "df", "encabezado": lambda c: f"{c}", "size_encabezado": 10,
+                 "etiqueta": lambda v: str(int(v)), "decimales": 3, "size": 11, "spacing": 15},
+    }
     
-    def generar_tabla_chi2(highlight_df=None):
-        """Genera la tabla Chi-cuadrado con valores críticos"""
-        # Niveles de significancia comunes
-        alphas = [0.995, 0.99, 0.975, 0.95, 0.90, 0.10, 0.05, 0.025, 0.01, 0.005]
+    def generar_tabla(tipo):
+        """Crea la DataTable de una tabla con un pool fijo de FILAS_POR_PAGINA filas
         
+        Devuelve la tabla, las filas del pool y, por fila, sus controles Text
+        (el 0 es la etiqueta). El contenido lo escribe mostrar_pagina.
+        """
+        formato = FORMATO_TABLAS[tipo]
         columnas = [
-            ft.DataColumn(ft.Text("df", weight=ft.FontWeight.BOLD, color=TEXT_MUTED, size=12))
+            ft.DataColumn(ft.Text(formato["titulo"], weight=ft.FontWeight.BOLD, color=TEXT_MUTED, size=12))
         ]
-        for alpha in alphas:
+        for c in tablas[tipo].columnas:
             columnas.append(
-                ft.DataColumn(ft.Text(f"{alpha}", weight=ft.FontWeight.BOLD, color=TEXT_MUTED, size=10))
+                ft.DataColumn(ft.Text(formato["encabezado"](c), weight=ft.FontWeight.BOLD,
+                                      color=TEXT_MUTED, size=formato["size_encabezado"]))
             )
         
         filas = []
-        dfs = list(range(1, 31))
+        textos = []
+        for _ in range(FILAS_POR_PAGINA):
+            fila_textos = [ft.Text("", weight=ft.FontWeight.BOLD, color="#ffffff", size=12)]
+            for _ in tablas[tipo].columnas:
+                fila_textos.append(ft.Text("", color="#c9d1d9", size=formato["size"]))
+            textos.append(fila_textos)
+            filas.append(ft.DataRow(cells=[ft.DataCell(t) for t in fila_textos]))
         
-        for df in dfs:
-            celdas = []
-            
-            # Determinar si esta fila debe resaltarse
-            highlight_row = False
-            if highlight_df is not None:
-                try:
-                    hdf = int(float(highlight_df))
-                    if df == hdf:
-                        highlight_row = True
-                except:
-                    pass
-            
-            celdas.append(ft.DataCell(
-                ft.Text(str(df), weight=ft.FontWeight.BOLD, 
-                       color=ACCENT_GREEN if highlight_row else "#ffffff", size=12)
-            ))
-            
-            for alpha in alphas:
-                chi2_val = EstadisticaPura.chi2_ppf(alpha, df)
-                celdas.append(ft.DataCell(
-                    ft.Text(f"{chi2_val:.3f}", 
-                           color=ACCENT_GREEN if highlight_row else "#c9d1d9", size=11)
-                ))
-            
-            filas.append(ft.DataRow(cells=celdas))
-        
-        return ft.DataTable(
+        tabla = ft.DataTable(
             columns=columnas,
             rows=filas,
             border=ft.Border.all(1, "#30363d"),
@@ -836,30 +850,178 @@ def main(page: ft.Page):
             vertical_lines=ft.BorderSide(1, "#30363d"),
             horizontal_lines=ft.BorderSide(1, "#30363d"),
             heading_row_color="#1f2937",
+            data_row_min_height=ALTO_FILA,
+            data_row_max_height=ALTO_FILA,
             data_row_color={"hovered": "#21262d"},
-            column_spacing=15
+            column_spacing=formato["spacing"]
         )
+        return tabla, filas, textos
     
     # Estado actual de la tabla seleccionada
     tabla_actual = {"tipo": "z"}
     
+    # Controles de cada tabla, construidos una sola vez por tipo
+    tablas_construidas = {}
+    
+    # Valores interpolados cuando el gl buscado no está tabulado
+    texto_interpolado = ft.Text("", size=12, color=ACCENT_GREEN, visible=False, selectable=True)
+    texto_pagina = ft.Text("", size=12, color=TEXT_MUTED)
+    
+    def obtener_tabla(tipo):
+        """Devuelve (construyendo la primera vez) los controles de la tabla"""
+        if tipo not in tablas_construidas:
+            tabla, filas, textos = generar_tabla(tipo)
+            estado = {
+                "filas": filas,
+                "textos": textos,
+                "columna": ft.Column([
+                    ft.Row([tabla], scroll=ft.ScrollMode.AUTO)
+                ], scroll=ft.ScrollMode.AUTO, expand=True),
+                "pagina": None,
+                "fila": None,
+                "celda": None,
+            }
+            tablas_construidas[tipo] = estado
+            mostrar_pagina(tipo, estado, 0)
+        return tablas_construidas[tipo]
+    
+    def total_paginas(tipo):
+        return (len(tablas[tipo].filas) + FILAS_POR_PAGINA - 1) // FILAS_POR_PAGINA
+    
+    def estilizar_fila(tipo, textos, activa, celda=None):
+        """Aplica el estilo normal o resaltado a una fila y devuelve sus controles"""
+        textos[0].color = ACCENT_GREEN if activa else "#ffffff"
+        for j, texto in enumerate(textos[1:]):
+            if tipo == "z":
+                es_celda = activa and j == celda
+                texto.color = ACCENT_GREEN if es_celda else ("#a5d6a7" if activa else "#c9d1d9")
+                texto.weight = ft.FontWeight.BOLD if es_celda else ft.FontWeight.NORMAL
+            else:
+                texto.color = ACCENT_GREEN if activa else "#c9d1d9"
+        return textos
+    
+    def mostrar_pagina(tipo, estado, pagina):
+        """Escribe en el pool las filas de la página; devuelve los controles cambiados"""
+        tabla = tablas[tipo]
+        formato = FORMATO_TABLAS[tipo]
+        estado["pagina"] = pagina
+        cambiados = []
+        inicio = pagina * FILAS_POR_PAGINA
+        for k, (fila, textos) in enumerate(zip(estado["filas"], estado["textos"])):
+            i = inicio + k
+            fila.visible = i < len(tabla.filas)
+            cambiados.append(fila)
+            if not fila.visible:
+                continue
+            textos[0].value = formato["etiqueta"](tabla.filas[i])
+            for texto, v in zip(textos[1:], tabla.fila(i)):
+                texto.value = f"{v:.{formato['decimales']}f}"
+            estilizar_fila(tipo, textos, i == estado["fila"], estado["celda"])
+        texto_pagina.value = (f"Filas {inicio + 1}–{min(inicio + FILAS_POR_PAGINA, len(tabla.filas))}"
+                              f" de {len(tabla.filas)}")
+        return cambiados + [texto_pagina]
+    
+    def buscar_posicion(tipo, valor):
+        """(fila, celda) que corresponden a la búsqueda; None si no hay coincidencia
+        
+        En Z el índice sale directo del valor: z = 2.37 -> fila 2.3, columna 7;
+        z = -1.96 -> fila -1.9, columna 6 (las filas negativas restan).
+        """
+        try:
+            v = float(valor)
+        except (TypeError, ValueError):
+            return None, None
+        if not math.isfinite(v):
+            # "nan", "inf" o "1e400" no tienen fila
+            return None, None
+        if tipo == "z":
+            mitad = len(tablas["z"].filas) // 2
+            centesimas = abs(v) * 100
+            decimas = math.floor(centesimas / 10 + 1e-9)
+            if decimas >= mitad:
+                return None, None
+            fila = mitad + decimas if v >= 0 else mitad - 1 - decimas
+            # La celda solo se resalta si el valor tiene como mucho dos decimales
+            celda = round(centesimas) % 10 if abs(centesimas - round(centesimas)) < 0.1 else None
+            return fila, celda
+        return tablas[tipo].indice_fila(int(v)), None
+    
+    def describir_interpolado(tipo, valor):
+        """Texto con la fila interpolada en gl (t en 1/gl), o None si no aplica"""
+        if tipo == "z":
+            return None
+        try:
+            df = float(valor)
+        except (TypeError, ValueError):
+            return None
+        tabla = tablas[tipo]
+        if not tabla.filas[0] < df < tabla.filas[-1] or tabla.indice_fila(df) is not None:
+            return None
+        transformar = (lambda g: 1 / g) if tipo == "t" else None
+        decimales = FORMATO_TABLAS[tipo]["decimales"]
+        valores = "  ".join(
+            f"{alpha}: {tabla.interpolar(df, j, transformar):.{decimales}f}"
+            for j, alpha in enumerate(tabla.columnas)
+        )
+        return f"gl ≈ {df:g} (interpolado) → {valores}"
+    
+    def refrescar(cambiados):
+        if page.controls and cambiados:
+            page.update(*cambiados)
+    
     def actualizar_tabla(e=None):
-        """Actualiza la tabla con el valor de búsqueda"""
+        """Salta a la página de la búsqueda y restila solo la fila anterior y la nueva"""
+        tipo = tabla_actual["tipo"]
+        estado = obtener_tabla(tipo)
+        cambiados = []
+        
+        if tabla_container.content is not estado["columna"]:
+            tabla_container.content = estado["columna"]
+            cambiados += mostrar_pagina(tipo, estado, estado["pagina"]) + [tabla_container]
+        
         valor_busqueda = search_value_tablas.value if search_value_tablas.value else None
+        fila, celda = buscar_posicion(tipo, valor_busqueda)
+        anterior = estado["fila"]
+        estado["fila"], estado["celda"] = fila, celda
         
-        if tabla_actual["tipo"] == "z":
-            tabla = generar_tabla_z(valor_busqueda)
-        elif tabla_actual["tipo"] == "t":
-            tabla = generar_tabla_t(valor_busqueda)
+        pagina = fila // FILAS_POR_PAGINA if fila is not None else estado["pagina"]
+        if pagina != estado["pagina"]:
+            cambiados += mostrar_pagina(tipo, estado, pagina)
         else:
-            tabla = generar_tabla_chi2(valor_busqueda)
+            inicio = pagina * FILAS_POR_PAGINA
+            for i in {anterior, fila}:
+                if i is not None and inicio <= i < inicio + FILAS_POR_PAGINA:
+                    cambiados += estilizar_fila(tipo, estado["textos"][i - inicio], i == fila, celda)
         
-        tabla_container.content = ft.Column([
-            ft.Row([tabla], scroll=ft.ScrollMode.AUTO)
-        ], scroll=ft.ScrollMode.AUTO, expand=True)
+        interpolado = describir_interpolado(tipo, valor_busqueda)
+        if interpolado != (texto_interpolado.value if texto_interpolado.visible else None):
+            texto_interpolado.value = interpolado or ""
+            texto_interpolado.visible = interpolado is not None
+            cambiados.append(texto_interpolado)
         
-        if page.controls:
-            page.update()
+        refrescar(cambiados)
+    
+    def cambiar_pagina(delta):
+        """Avanza o retrocede una página en la tabla actual"""
+        tipo = tabla_actual["tipo"]
+        estado = obtener_tabla(tipo)
+        pagina = min(max(estado["pagina"] + delta, 0), total_paginas(tipo) - 1)
+        if pagina != estado["pagina"]:
+            refrescar(mostrar_pagina(tipo, estado, pagina))
+    
+    navegacion_tabla = ft.Row([
+        ft.IconButton(ft.Icons.CHEVRON_LEFT, on_click=lambda e: cambiar_pagina(-1)),
+        texto_pagina,
+        ft.IconButton(ft.Icons.CHEVRON_RIGHT, on_click=lambda e: cambiar_pagina(1)),
+        ft.IconButton(ft.Icons.MY_LOCATION, tooltip="Ir al valor buscado", on_click=lambda e: ir_a_busqueda()),
+    ], alignment=ft.MainAxisAlignment.CENTER, spacing=4)
+    
+    def ir_a_busqueda():
+        """Vuelve a la página del valor buscado aunque se haya paginado a mano"""
+        tipo = tabla_actual["tipo"]
+        estado = obtener_tabla(tipo)
+        if estado["fila"] is not None and estado["fila"] // FILAS_POR_PAGINA != estado["pagina"]:
+            refrescar(mostrar_pagina(tipo, estado, estado["fila"] // FILAS_POR_PAGINA))
     
     def on_tab_change(e):
         """Cambia entre las diferentes tablas"""
@@ -876,8 +1038,9 @@ def main(page: ft.Page):
         
         actualizar_tabla()
     
-    # Conectar evento de búsqueda
+    # Conectar evento de búsqueda (Enter también salta al valor)
     search_value_tablas.on_change = actualizar_tabla
+    search_value_tablas.on_submit = actualizar_tabla
     
     # Estado de tab seleccionado
     tab_seleccionado = {"valor": "z"}
@@ -929,9 +1092,7 @@ def main(page: ft.Page):
     actualizar_tabs()
     
     # Inicializar tabla Z por defecto
-    tabla_container.content = ft.Column([
-        ft.Row([generar_tabla_z()], scroll=ft.ScrollMode.AUTO)
-    ], scroll=ft.ScrollMode.AUTO, expand=True)
+    tabla_container.content = obtener_tabla("z")["columna"]
     
     vista_tablas = ft.Container(
         content=ft.Column([
@@ -956,6 +1117,14 @@ def main(page: ft.Page):
                 content=search_value_tablas,
                 padding=ft.Padding(16, 10, 16, 10)
             ),
+            ft.Container(
+                content=texto_interpolado,
+                padding=ft.Padding(16, 0, 16, 8)
+            ),
+            ft.Container(
+                content=navegacion_tabla,
+                padding=ft.Padding(16, 0, 16, 0)
+            ),
             # Tabla
             ft.Container(
                 content=tabla_container,
@@ -967,52 +1136,8 @@ def main(page: ft.Page):
     )
 
     # --- Calculadora: Lógica de estadísticas descriptivas ---
-    def calcular_estadisticas_descriptivas(datos):
-        """Calcula estadísticas descriptivas básicas"""
-        if not datos:
-            return {}
-        
-        n = len(datos)
-        suma = sum(datos)
-        media = suma / n
-        
-        # Ordenar para mediana
-        ordenados = sorted(datos)
-        if n % 2 == 0:
-            mediana = (ordenados[n//2 - 1] + ordenados[n//2]) / 2
-        else:
-            mediana = ordenados[n//2]
-        
-        # Moda (valor más frecuente)
-        frecuencias = {}
-        for d in datos:
-            frecuencias[d] = frecuencias.get(d, 0) + 1
-        max_freq = max(frecuencias.values())
-        modas = [k for k, v in frecuencias.items() if v == max_freq]
-        moda = modas[0] if len(modas) == 1 else "Múltiple"
-        
-        # Varianza y desviación estándar
-        varianza = sum((x - media) ** 2 for x in datos) / n
-        desv_std = varianza ** 0.5
-        
-        # Varianza muestral (n-1)
-        varianza_muestral = sum((x - media) ** 2 for x in datos) / (n - 1) if n > 1 else 0
-        desv_std_muestral = varianza_muestral ** 0.5
-        
-        return {
-            "n": n,
-            "suma": suma,
-            "media": media,
-            "mediana": mediana,
-            "moda": moda,
-            "min": min(datos),
-            "max": max(datos),
-            "rango": max(datos) - min(datos),
-            "varianza": varianza,
-            "desv_std": desv_std,
-            "varianza_m": varianza_muestral,
-            "desv_std_m": desv_std_muestral
-        }
+    # Sesión incremental: cada cálculo solo procesa lo que se agregó al texto
+    sesion_calc = SesionDescriptiva(precision_cuantiles=EstadisticaLogic.precision_cuantiles)
     
     # Input de datos
     calc_input = ft.TextField(
@@ -1045,68 +1170,280 @@ def main(page: ft.Page):
             padding=12
         )
     
+    def valor_stat_card(card):
+        """Text con el valor de una tarjeta creada por crear_stat_card"""
+        return card.content.controls[1].controls[1]
+    
+    # Tarjetas del panel de resultados: se crean una vez y luego solo cambian sus valores
+    stat_cards = {
+        "n": crear_stat_card("Cantidad (n)", 0, ft.Icons.NUMBERS),
+        "media": crear_stat_card("Media (μ)", 0, ft.Icons.SHOW_CHART),
+        "mediana": crear_stat_card("Mediana", 0, ft.Icons.ALIGN_VERTICAL_CENTER),
+        "moda": crear_stat_card("Moda", 0, ft.Icons.STAR),
+        "suma": crear_stat_card("Suma (Σ)", 0, ft.Icons.ADD),
+        "desv_std": crear_stat_card("Desv. Std (σ)", 0, ft.Icons.STACKED_LINE_CHART),
+        "varianza": crear_stat_card("Varianza (σ²)", 0, ft.Icons.SQUARE),
+        "rango": crear_stat_card("Rango", 0, ft.Icons.SWAP_VERT),
+        "min": crear_stat_card("Mínimo", 0, ft.Icons.ARROW_DOWNWARD, "#ef4444"),
+        "max": crear_stat_card("Máximo", 0, ft.Icons.ARROW_UPWARD, "#22c55e"),
+        "varianza_m": crear_stat_card("Varianza (s²)", 0, ft.Icons.SQUARE_OUTLINED),
+        "desv_std_m": crear_stat_card("Desv. Std (s)", 0, ft.Icons.STACKED_LINE_CHART),
+        "q1": crear_stat_card("Cuartil 1 (Q1)", 0, ft.Icons.FIRST_PAGE, "#3b82f6"),
+        "q3": crear_stat_card("Cuartil 3 (Q3)", 0, ft.Icons.LAST_PAGE, "#3b82f6"),
+        "iqr": crear_stat_card("Rango intercuartil", 0, ft.Icons.UNFOLD_MORE, "#3b82f6"),
+        "error_estandar": crear_stat_card("Error estándar", 0, ft.Icons.TRACK_CHANGES, "#3b82f6"),
+        "asimetria": crear_stat_card("Asimetría", 0, ft.Icons.TRENDING_UP, "#a78bfa"),
+        "curtosis": crear_stat_card("Curtosis (exceso)", 0, ft.Icons.FILTER_HDR, "#a78bfa"),
+        "cv": crear_stat_card("Coef. variación", 0, ft.Icons.PERCENT, "#a78bfa"),
+    }
+    
+    # Percentiles a pedido: una tarjeta por valor escrito
+    calc_percentiles = ft.TextField(
+        label="Percentiles",
+        value="10, 90",
+        hint_text="Ej: 5, 95",
+        bgcolor="#1f2937",
+        border_color="#3b82f6",
+        focused_border_color=ACCENT_GREEN,
+        height=50
+    )
+    fila_percentiles = ft.Row(wrap=True, spacing=8, run_spacing=8)
+    
+    # Distribución de frecuencias: regla de clases, barras y tabla
+    regla_clases = ft.Dropdown(
+        value="sturges",
+        options=[ft.dropdown.Option(clave, nombre) for clave, nombre in HistogramaFijo.REGLAS.items()],
+        bgcolor="#1f2937",
+        width=220
+    )
+    grafico_frecuencias = ft.Container()
+    nota_frecuencias = ft.Text("", size=11, color=TEXT_MUTED)
+    tabla_frecuencias = ft.DataTable(
+        columns=[
+            ft.DataColumn(ft.Text(titulo, weight=ft.FontWeight.BOLD, color=TEXT_MUTED, size=12), numeric=numerica)
+            for titulo, numerica in (("Clase", False), ("Marca", True), ("f", True),
+                                     ("fr", True), ("F", True), ("Fr", True))
+        ],
+        rows=[],
+        border=ft.Border.all(1, "#30363d"),
+        border_radius=8,
+        vertical_lines=ft.BorderSide(1, "#30363d"),
+        horizontal_lines=ft.BorderSide(1, "#30363d"),
+        heading_row_color="#1f2937",
+        data_row_min_height=32,
+        data_row_max_height=32,
+        data_row_color={"hovered": "#21262d"},
+        column_spacing=16
+    )
+    
+    panel_stats = ft.Column([
+        ft.Text("📊 Resultados", size=14, weight=ft.FontWeight.BOLD, color=ACCENT_GREEN),
+        ft.Container(height=8),
+        ft.Row([
+            ft.Column([stat_cards[k] for k in ("n", "media", "mediana", "moda")], spacing=8, expand=True),
+            ft.Column([stat_cards[k] for k in ("suma", "desv_std", "varianza", "rango")], spacing=8, expand=True),
+        ], spacing=8),
+        ft.Container(height=12),
+        ft.Text("📐 Valores Extremos", size=12, weight=ft.FontWeight.W_500, color=TEXT_MUTED),
+        ft.Container(height=4),
+        ft.Row([stat_cards["min"], stat_cards["max"]], spacing=8),
+        ft.Container(height=12),
+        ft.Text("📏 Muestrales (n-1)", size=12, weight=ft.FontWeight.W_500, color=TEXT_MUTED),
+        ft.Container(height=4),
+        ft.Row([stat_cards["varianza_m"], stat_cards["desv_std_m"]], spacing=8),
+        ft.Container(height=12),
+        ft.Text("📦 Posición", size=12, weight=ft.FontWeight.W_500, color=TEXT_MUTED),
+        ft.Container(height=4),
+        ft.Row([
+            ft.Column([stat_cards[k] for k in ("q1", "iqr")], spacing=8, expand=True),
+            ft.Column([stat_cards[k] for k in ("q3", "error_estandar")], spacing=8, expand=True),
+        ], spacing=8),
+        ft.Container(height=8),
+        fila_percentiles,
+        ft.Container(height=12),
+        ft.Text("📈 Forma", size=12, weight=ft.FontWeight.W_500, color=TEXT_MUTED),
+        ft.Container(height=4),
+        ft.Row([stat_cards[k] for k in ("asimetria", "curtosis", "cv")], spacing=8),
+        ft.Container(height=12),
+        ft.Row([
+            ft.Text("📊 Distribución de frecuencias", size=12, weight=ft.FontWeight.W_500, color=TEXT_MUTED),
+            regla_clases,
+        ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+        ft.Container(height=4),
+        grafico_frecuencias,
+        nota_frecuencias,
+        ft.Container(height=8),
+        ft.Row([tabla_frecuencias], scroll=ft.ScrollMode.AUTO),
+    ], scroll=ft.ScrollMode.AUTO)
+    
+    def mostrar_frecuencias():
+        """Clases de la regla elegida: histograma de barras y tabla de frecuencias"""
+        histograma = sesion_calc.histograma(regla_clases.value)
+        if histograma is None:
+            return
+        grafico_frecuencias.content = crear_histograma(histograma, alto=140)
+        filas = histograma.tabla_frecuencias()
+        tabla_frecuencias.rows = [
+            ft.DataRow(cells=[
+                ft.DataCell(ft.Text(f"[{fila['desde']:.4g}, {fila['hasta']:.4g}{']' if i == len(filas) - 1 else ')'}", size=12)),
+                ft.DataCell(ft.Text(f"{fila['marca']:.4g}", size=12)),
+                ft.DataCell(ft.Text(f"{fila['f']:,}", size=12, color=ACCENT_GREEN)),
+                ft.DataCell(ft.Text(f"{fila['fr']:.4f}", size=12)),
+                ft.DataCell(ft.Text(f"{fila['F']:,}", size=12)),
+                ft.DataCell(ft.Text(f"{fila['Fr']:.4f}", size=12)),
+            ])
+            for i, fila in enumerate(filas)
+        ]
+        nota = f"{histograma.bins} clases de ancho {histograma.ancho:.4g}"
+        if sesion_calc.aproximado:
+            nota += ". Bordes fijos desde el paso a modo aproximado"
+        nota_frecuencias.value = nota
+    
+    def on_regla_clases(e):
+        if sesion_calc.n:
+            mostrar_frecuencias()
+            page.update()
+    
+    regla_clases.on_select = on_regla_clases
+    
+    def mostrar_stats():
+        """Escribe los resultados de la sesión en las tarjetas"""
+        stats = sesion_calc.resultados()
+        if not stats:
+            calc_resultados.visible = False
+            page.update()
+            return
+        
+        for clave, card in stat_cards.items():
+            valor = stats[clave]
+            texto = str(valor) if isinstance(valor, str) else f"{valor:.4f}"
+            # Con muchos datos la mediana sale del t-digest
+            if clave == "mediana" and stats["aproximado"]:
+                texto = f"≈ {texto}"
+            valor_stat_card(card).value = texto
+        
+        # Los percentiles salen del mismo orden (o t-digest) que la mediana
+        percentiles = []
+        for token in (calc_percentiles.value or "").replace(",", " ").split():
+            try:
+                percentiles.append(float(token))
+            except ValueError:
+                continue  # Un percentil mal escrito no invalida el resto de la sesión
+        prefijo = "≈ " if stats["aproximado"] else ""
+        fila_percentiles.controls = [
+            ft.Container(
+                content=crear_stat_card(f"Percentil {p:g}", sesion_calc.percentil(p), ft.Icons.LINEAR_SCALE, "#3b82f6"),
+                width=170
+            )
+            for p in percentiles if 0 <= p <= 100
+        ]
+        for tarjeta in fila_percentiles.controls:
+            valor = valor_stat_card(tarjeta.content)
+            valor.value = prefijo + valor.value
+        
+        mostrar_frecuencias()
+        
+        calc_resultados.content = panel_stats
+        calc_resultados.visible = True
+        page.update()
+    
     def on_calcular_stats(e):
-        """Procesa los datos y muestra estadísticas"""
+        """Procesa los datos nuevos y actualiza las tarjetas de estadísticas"""
         try:
-            texto = calc_input.value.strip()
-            if not texto:
+            texto = calc_input.value or ""
+            if not texto.startswith(sesion_calc.texto):
+                # Se editó texto ya procesado: la sesión se rehace solo con el texto
+                texto_archivo.value = ""
+            if not texto.strip() and not texto_archivo.value:
+                sesion_calc.reiniciar()
+                texto_pendiente.visible = False
                 calc_resultados.visible = False
                 page.update()
                 return
             
-            # Parsear datos (comas o espacios)
-            texto = texto.replace(",", " ")
-            datos = [float(x.strip()) for x in texto.split() if x.strip()]
-            
-            if not datos:
-                calc_resultados.visible = False
-                page.update()
-                return
-            
-            stats = calcular_estadisticas_descriptivas(datos)
-            
-            # Crear grid de resultados
-            calc_resultados.content = ft.Column([
-                ft.Text("📊 Resultados", size=14, weight=ft.FontWeight.BOLD, color=ACCENT_GREEN),
-                ft.Container(height=8),
-                ft.Row([
-                    ft.Column([
-                        crear_stat_card("Cantidad (n)", stats["n"], ft.Icons.NUMBERS),
-                        crear_stat_card("Media (μ)", stats["media"], ft.Icons.SHOW_CHART),
-                        crear_stat_card("Mediana", stats["mediana"], ft.Icons.ALIGN_VERTICAL_CENTER),
-                        crear_stat_card("Moda", stats["moda"], ft.Icons.STAR),
-                    ], spacing=8, expand=True),
-                    ft.Column([
-                        crear_stat_card("Suma (Σ)", stats["suma"], ft.Icons.ADD),
-                        crear_stat_card("Desv. Std (σ)", stats["desv_std"], ft.Icons.STACKED_LINE_CHART),
-                        crear_stat_card("Varianza (σ²)", stats["varianza"], ft.Icons.SQUARE),
-                        crear_stat_card("Rango", stats["rango"], ft.Icons.SWAP_VERT),
-                    ], spacing=8, expand=True),
-                ], spacing=8),
-                ft.Container(height=12),
-                ft.Text("📐 Valores Extremos", size=12, weight=ft.FontWeight.W_500, color=TEXT_MUTED),
-                ft.Container(height=4),
-                ft.Row([
-                    crear_stat_card("Mínimo", stats["min"], ft.Icons.ARROW_DOWNWARD, "#ef4444"),
-                    crear_stat_card("Máximo", stats["max"], ft.Icons.ARROW_UPWARD, "#22c55e"),
-                ], spacing=8),
-                ft.Container(height=12),
-                ft.Text("📏 Muestrales (n-1)", size=12, weight=ft.FontWeight.W_500, color=TEXT_MUTED),
-                ft.Container(height=4),
-                ft.Row([
-                    crear_stat_card("Varianza (s²)", stats["varianza_m"], ft.Icons.SQUARE_OUTLINED),
-                    crear_stat_card("Desv. Std (s)", stats["desv_std_m"], ft.Icons.STACKED_LINE_CHART),
-                ], spacing=8),
-            ], scroll=ft.ScrollMode.AUTO)
-            
-            calc_resultados.visible = True
-            page.update()
+            # Solo se interpreta lo agregado desde el último cálculo
+            sesion_calc.sincronizar(texto)
+            pendiente = sesion_calc.pendiente
+            texto_pendiente.value = f"«{pendiente}» se suma al escribir un separador" if pendiente else ""
+            texto_pendiente.visible = bool(pendiente)
+            mostrar_stats()
             
         except Exception as ex:
+            # sincronizar interpreta antes de tocar la sesión: los datos
+            # (incluidos los importados) siguen ahí para el próximo intento
             calc_resultados.content = ft.Text(f"Error: {ex}", color="#ef4444")
             calc_resultados.visible = True
             page.update()
     
+    # --- Importación de archivos por bloques ---
+    file_picker = ft.FilePicker()
+    importacion = {"cancelar": threading.Event()}
+    barra_importacion = ft.ProgressBar(value=0, color=ACCENT_GREEN, bgcolor="#1f2937", visible=False)
+    texto_importacion = ft.Text("", size=12, color=TEXT_MUTED, visible=False)
+    # Nombre del archivo cuyos datos están en la sesión (vacío si solo hay texto)
+    texto_archivo = ft.Text("", size=12, color=ACCENT_GREEN)
+    # Con muchos datos el último número sin separador espera (ver SesionDescriptiva)
+    texto_pendiente = ft.Text("", size=11, color=TEXT_MUTED, visible=False)
+    
+    def importar_archivo(ruta, nombre):
+        """Lee el archivo en un hilo aparte, alimentando la sesión bloque a bloque"""
+        cancelar = importacion["cancelar"]
+        try:
+            importador = ImportadorDatos(ruta)
+            for bloque in importador.bloques(cancelar):
+                sesion_calc.agregar_muchos(bloque)
+                barra_importacion.value = importador.progreso
+                texto_importacion.value = f"{sesion_calc.n:,} valores leídos ({importador.progreso:.0%})"
+                page.update(barra_importacion, texto_importacion)
+            if cancelar.is_set():
+                sesion_calc.reiniciar()
+                texto_archivo.value = ""
+                texto_importacion.value = "Importación cancelada"
+            else:
+                extra = f", {importador.ignorados} textos ignorados" if importador.ignorados else ""
+                texto_archivo.value = f"📄 {nombre}: {sesion_calc.n:,} valores{extra}"
+                texto_importacion.visible = False
+                mostrar_stats()
+        except Exception as ex:
+            sesion_calc.reiniciar()
+            texto_archivo.value = ""
+            texto_importacion.value = f"Error: {ex}"
+        finally:
+            barra_importacion.visible = False
+            btn_cancelar_importacion.visible = False
+            btn_importar.disabled = False
+            btn_calcular_stats.disabled = False
+            page.update()
+    
+    async def on_importar(e):
+        archivos = await file_picker.pick_files(
+            dialog_title="Importar datos",
+            file_type=ft.FilePickerFileType.CUSTOM,
+            allowed_extensions=["csv", "txt", "dat"]
+        )
+        if not archivos or not archivos[0].path:
+            return
+        # Los datos del archivo reemplazan a los actuales; lo que se escriba después se suma
+        sesion_calc.reiniciar()
+        calc_input.value = ""
+        texto_pendiente.visible = False
+        importacion["cancelar"] = threading.Event()
+        barra_importacion.value = 0
+        barra_importacion.visible = True
+        texto_importacion.value = f"Leyendo {archivos[0].name}..."
+        texto_importacion.visible = True
+        btn_cancelar_importacion.visible = True
+        btn_importar.disabled = True
+        btn_calcular_stats.disabled = True
+        page.update()
+        page.run_thread(importar_archivo, archivos[0].path, archivos[0].name)
+    
+    btn_importar = ft.TextButton("Importar archivo", icon=ft.Icons.UPLOAD_FILE, on_click=on_importar)
+    btn_cancelar_importacion = ft.TextButton(
+        "Cancelar", icon=ft.Icons.CLOSE, visible=False,
+        on_click=lambda e: importacion["cancelar"].set()
+    )
+    
     btn_calcular_stats = ft.Container(
         content=ft.Row([
             ft.Icon(ft.Icons.CALCULATE, color="#000000", size=20),
@@ -1138,6 +1475,13 @@ def main(page: ft.Page):
                         crear_seccion_titulo("INGRESA TUS DATOS"),
                         ft.Container(height=8),
                         calc_input,
+                        ft.Container(height=8),
+                        calc_percentiles,
+                        ft.Row([btn_importar, btn_cancelar_importacion], spacing=4),
+                        texto_archivo,
+                        texto_pendiente,
+                        barra_importacion,
+                        texto_importacion,
                         ft.Container(height=12),
                         btn_calcular_stats
                     ])),
@@ -1408,6 +1752,23 @@ def main(page: ft.Page):
         width=200
     )
     
+    def on_precision_cuantiles_change(e):
+        """Cambia el error de los cuantiles aproximados (rige desde la próxima simulación o carga grande)"""
+        EstadisticaLogic.configurar_precision_cuantiles(e.control.value)
+        sesion_calc.precision_cuantiles = EstadisticaLogic.precision_cuantiles
+    
+    precision_cuantiles_dropdown = ft.Dropdown(
+        value="0.005",
+        options=[
+            ft.dropdown.Option("0.01", "± 1 %"),
+            ft.dropdown.Option("0.005", "± 0.5 %"),
+            ft.dropdown.Option("0.001", "± 0.1 %"),
+        ],
+        bgcolor="#1f2937",
+        width=200,
+        on_select=on_precision_cuantiles_change
+    )
+    
     def crear_ajuste_item(icono, titulo, descripcion, control):
         """Crea un item de ajuste con icono, texto y control"""
         return ft.Container(
@@ -1451,6 +1812,12 @@ def main(page: ft.Page):
                             "Cantidad de decimales en resultados",
                             decimales_dropdown
                         ),
+                        crear_ajuste_item(
+                            ft.Icons.TUNE,
+                            "Precisión de cuantiles",
+                            "Error de rango de mediana y percentiles con muchos datos (más precisión usa más memoria)",
+                            precision_cuantiles_dropdown
+                        ),
                     ])),
                     # Sección Info
                     crear_card(ft.Column([
@@ -1,14 +1,180 @@
 
+import bisect
+import hashlib
 import math
+import mmap
+import os
 import random
+import struct
+import sys
+import threading
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import flet as ft
+import flet_charts as fch
+
+try:
+    import numpy as np
+except ImportError:  # El APK se empaqueta sin NumPy
+    np = None
 
 # ==========================================
 # 1. ESTADÍSTICA PURA (SIN SCIPY/NUMPY)
 # ==========================================
 class EstadisticaPura:
     """Implementación de funciones estadísticas usando solo math y random"""
+
+    # Coeficientes de la aproximación de Acklam para normal_ppf
+    _ACKLAM_A = (-39.69683028665376, 220.9460984245205, -275.9285104469687, 138.3577518672690, -30.66479806614716, 2.506628277459239)
+    _ACKLAM_B = (-54.47609879822406, 161.5858368580409, -155.6989798598866, 66.80131188771972, -13.28068155288572)
+    _ACKLAM_C = (-0.007784894002430293, -0.3223964580411365, -2.400758277161838, -2.549732539343734, 4.374664141464968, 2.938163982698783)
+    _ACKLAM_D = (0.007784695709041462, 0.3224671290700398, 2.445134137142996, 3.754408661907416)
+
+    # Ancho mínimo (px) de una barra en los gráficos discretos; quien dibuja
+    # el chart divide su ancho por este valor para saber cuántas barras caben
+    ANCHO_MIN_BARRA = 6
     
+    # ==========================================
+    # FUNCIONES ESPECIALES
+    # ==========================================
+    @staticmethod
+    def _beta_cf(a, b, x):
+        """Fracción continua de la beta incompleta (método de Lentz)"""
+        tiny = 1e-300
+        qab = a + b
+        qap = a + 1
+        qam = a - 1
+        c = 1.0
+        d = 1 - qab * x / qap
+        if abs(d) < tiny: d = tiny
+        d = 1 / d
+        h = d
+        for m in range(1, 301):
+            m2 = 2 * m
+            aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+            d = 1 + aa * d
+            if abs(d) < tiny: d = tiny
+            c = 1 + aa / c
+            if abs(c) < tiny: c = tiny
+            d = 1 / d
+            h *= d * c
+            aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+            d = 1 + aa * d
+            if abs(d) < tiny: d = tiny
+            c = 1 + aa / c
+            if abs(c) < tiny: c = tiny
+            d = 1 / d
+            delta = d * c
+            h *= delta
+            if abs(delta - 1) < 1e-15:
+                break
+        return h
+
+    @staticmethod
+    def beta_inc(a, b, x, y=None):
+        """Beta incompleta regularizada I_x(a, b)
+
+        `y` permite pasar 1 - x calculado sin cancelación (colas con gl grandes).
+        """
+        if y is None:
+            y = 1 - x
+        if x <= 0: return 0.0
+        if y <= 0: return 1.0
+        ln_front = (math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                    + a * math.log(x) + b * math.log(y))
+        front = math.exp(ln_front)
+        # La fracción continua converge rápido solo en un lado; se usa la simetría
+        if x < (a + 1) / (a + b + 2):
+            return front * EstadisticaPura._beta_cf(a, b, x) / a
+        return 1 - front * EstadisticaPura._beta_cf(b, a, y) / b
+
+    @staticmethod
+    def _gamma_serie(a, x):
+        """P(a, x) por serie (converge rápido para x < a + 1)"""
+        ap = a
+        term = 1.0 / a
+        total = term
+        # Cerca de x ≈ a hacen falta del orden de sqrt(a) términos
+        for _ in range(200 + int(10 * math.sqrt(a))):
+            ap += 1
+            term *= x / ap
+            total += term
+            if abs(term) < abs(total) * 1e-16:
+                break
+        return total * math.exp(-x + a * math.log(x) - math.lgamma(a))
+
+    @staticmethod
+    def _gamma_cf(a, x):
+        """Q(a, x) por fracción continua (converge rápido para x >= a + 1)"""
+        tiny = 1e-300
+        b = x + 1 - a
+        c = 1 / tiny
+        d = 1 / b
+        h = d
+        for i in range(1, 201 + int(10 * math.sqrt(a))):
+            an = -i * (i - a)
+            b += 2
+            d = an * d + b
+            if abs(d) < tiny: d = tiny
+            c = b + an / c
+            if abs(c) < tiny: c = tiny
+            d = 1 / d
+            delta = d * c
+            h *= delta
+            if abs(delta - 1) < 1e-15:
+                break
+        return math.exp(-x + a * math.log(x) - math.lgamma(a)) * h
+
+    @staticmethod
+    def gamma_inc(a, x):
+        """Gamma incompleta regularizada inferior P(a, x)"""
+        if x <= 0: return 0.0
+        if x < a + 1:
+            return EstadisticaPura._gamma_serie(a, x)
+        return 1 - EstadisticaPura._gamma_cf(a, x)
+
+    @staticmethod
+    def gamma_inc_sup(a, x):
+        """Gamma incompleta regularizada superior Q(a, x) = 1 - P(a, x)"""
+        if x <= 0: return 1.0
+        if x < a + 1:
+            return 1 - EstadisticaPura._gamma_serie(a, x)
+        return EstadisticaPura._gamma_cf(a, x)
+
+    @staticmethod
+    def _invertir_cdf(cdf, sf, pdf, p, x0, lo=0.0, tol=1e-13, max_iter=100, q=None):
+        """Resuelve cdf(x) = p con Newton protegido por bisección
+
+        El intervalo [lo, hi] siempre contiene la raíz; hi empieza abierto
+        (infinito) y se acota la primera vez que la CDF supera a p. Si un paso
+        de Newton sale del intervalo se biseca (o se duplica x mientras hi
+        siga abierto). Termina cuando el paso relativo es menor que `tol`.
+        `q` es 1 - p cuando quien llama lo conoce sin redondeo.
+        """
+        if q is None:
+            q = 1 - p
+        hi = float('inf')
+        x = x0
+        for _ in range(max_iter):
+            # En la cola derecha se compara con la SF para no perder dígitos
+            error = q - sf(x) if p > 0.5 else cdf(x) - p
+            if error == 0:
+                return x
+            if error > 0:
+                hi = x
+            else:
+                lo = x
+            densidad = pdf(x)
+            x_nuevo = x - error / densidad if densidad > 0 else lo
+            if not lo < x_nuevo < hi:
+                x_nuevo = (lo + hi) / 2 if hi != float('inf') else 2 * x + 1
+            if abs(x_nuevo - x) <= tol * abs(x):
+                return x_nuevo
+            x = x_nuevo
+        return x
+
     @staticmethod
     def normal_pdf(x, mu=0, sigma=1):
         """Función de Densidad de Probabilidad Normal"""
@@ -17,21 +183,22 @@ class EstadisticaPura:
 
     @staticmethod
     def normal_cdf(x, mu=0, sigma=1):
-        """Función de Distribución Acumulada Normal (aprox. usando erf)"""
-        return 0.5 * (1 + math.erf((x - mu) / (sigma * math.sqrt(2))))
+        """Función de Distribución Acumulada Normal (con erfc, exacta también en la cola izquierda)"""
+        return 0.5 * math.erfc(-(x - mu) / (sigma * math.sqrt(2)))
     
     @staticmethod
     def normal_ppf(p, mu=0, sigma=1):
         """Función Percentil Normal (Inversa CDF) - Aprox. Acklam"""
         # Algoritmo de Peter J. Acklam para la inversa de la normal estándar
-        if p <= 0 or p >= 1:
-            return 0.0 # Manejo básico de bordes
+        if p <= 0:
+            return float('-inf')
+        if p >= 1:
+            return float('inf')
         
-        # Coeficientes para la aproximación
-        a1, a2, a3, a4, a5, a6 = -39.69683028665376, 220.9460984245205, -275.9285104469687, 138.3577518672690, -30.66479806614716, 2.506628277459239
-        b1, b2, b3, b4, b5 = -54.47609879822406, 161.5858368580409, -155.6989798598866, 66.80131188771972, -13.28068155288572
-        c1, c2, c3, c4, c5, c6 = -0.007784894002430293, -0.3223964580411365, -2.400758277161838, -2.549732539343734, 4.374664141464968, 2.938163982698783
-        d1, d2, d3, d4 = 0.007784695709041462, 0.3224671290700398, 2.445134137142996, 3.754408661907416
+        a1, a2, a3, a4, a5, a6 = EstadisticaPura._ACKLAM_A
+        b1, b2, b3, b4, b5 = EstadisticaPura._ACKLAM_B
+        c1, c2, c3, c4, c5, c6 = EstadisticaPura._ACKLAM_C
+        d1, d2, d3, d4 = EstadisticaPura._ACKLAM_D
         
         q = min(p, 1 - p)
         if q > 0.02425:
@@ -44,68 +211,90 @@ class EstadisticaPura:
             r = math.sqrt(-2 * math.log(q))
             z = (((((c1 * r + c2) * r + c3) * r + c4) * r + c5) * r + c6) / ((((d1 * r + d2) * r + d3) * r + d4) * r + 1)
         
-        if p < 0.5:
-            z = -z # Si es la cola izquierda, invertimos
+        if p > 0.5:
+            z = -z # z se calculó para la cola izquierda q; en la derecha se invierte
             
         return mu + sigma * z
 
     @staticmethod
     def t_pdf(x, df):
         """PDF t-Student"""
-        # Gamma aproximado para evitar dependencias complejas si es necesario, 
-        # pero math.gamma existe en Py3.11+. Asumimos Py3.11 disponible en build.
-        try:
-            from math import gamma
-            term1 = gamma((df + 1) / 2) / (math.sqrt(df * math.pi) * gamma(df / 2))
-            term2 = (1 + (x**2) / df) ** (-(df + 1) / 2)
-            return term1 * term2
-        except:
-             return 0.0 # Fallback
+        log_c = math.lgamma((df + 1) / 2) - math.lgamma(df / 2) - 0.5 * math.log(df * math.pi)
+        return math.exp(log_c - (df + 1) / 2 * math.log1p(x * x / df))
 
     @staticmethod
     def t_cdf(x, df):
-        """CDF t-Student (Aprox. simple para visualización)"""
-        # Aproximación usando normal si df es grande, o integración numérica simple
-        if df > 30:
-            return EstadisticaPura.normal_cdf(x)
-        # Integración numérica simple (Trapecios) desde un valor muy bajo
-        t = -10.0
-        dt = 0.1
-        area = 0.0
-        while t < x:
-            area += EstadisticaPura.t_pdf(t, df) * dt
-            t += dt
-        return min(max(area, 0), 1)
+        """CDF t-Student vía beta incompleta regularizada"""
+        x2 = x * x
+        cola = 0.5 * EstadisticaPura.beta_inc(df / 2, 0.5, df / (df + x2), x2 / (df + x2))
+        return 1 - cola if x > 0 else cola
+
+    @staticmethod
+    def t_sf(x, df):
+        """Función de supervivencia t-Student: P(T > x)"""
+        return EstadisticaPura.t_cdf(-x, df)
+
+    @staticmethod
+    def _t_hill(p2, n, constantes):
+        """Cuantil t de dos colas (algoritmo 396 de Hill); p2 = 2·P(T > t)"""
+        if n == 2:
+            return math.sqrt(2 / (p2 * (2 - p2)) - 2)
+        if n <= 1:
+            # Exacto para Cauchy (n = 1); punto de partida para n < 1
+            return math.cos(p2 * math.pi / 2) / math.sin(p2 * math.pi / 2)
+        a, b, c, d = constantes
+        x = d * p2
+        y = x ** (2 / n)
+        if y > 0.05 + a:
+            x = EstadisticaPura.normal_ppf(p2 * 0.5)
+            y = x * x
+            if n < 5:
+                c += 0.3 * (n - 4.5) * (x + 0.6)
+            c = (((0.05 * d * x - 5) * x - 7) * x - 2) * x + b + c
+            y = (((((0.4 * y + 6.3) * y + 36) * y + 94.5) / c - y - 3) / b + 1) * x
+            y = math.expm1(a * y * y)
+        else:
+            y = ((1 / (((n + 6) / (n * y) - 0.089 * d - 0.822) * (n + 2) * 3)
+                  + 0.5 / (n + 4)) * y - 1) * (n + 1) / (n + 2) + 1 / y
+        return math.sqrt(n * y)
 
     @staticmethod
     def t_ppf(p, df):
-        """t-Student PPF (Aproximación basada en Normal)"""
-        z = EstadisticaPura.normal_ppf(p)
-        # Aproximación de Peizer-Pratt o similar para ajustar Z a T
-        # Para APK simple, usamos Z como base y ajustamos ligeramente por grados de libertad
-        if df > 30:
-             return z
-        return z * (df / (df - 2))**0.5 if df > 2 else z * 1.5 # Muy aproximado
+        """t-Student PPF (Hill + Newton sobre la CDF exacta)"""
+        return BackendPuro.t_ppf_many([p], df)[0]
 
     @staticmethod
     def chi2_pdf(x, k):
         """PDF Chi-Cuadrado"""
         if x <= 0: return 0.0
-        try:
-            from math import gamma
-            num = (x ** (k/2 - 1)) * math.exp(-x/2)
-            den = (2 ** (k/2)) * gamma(k/2)
-            return num / den
-        except:
-            return 0.0
+        log_pdf = (k / 2 - 1) * math.log(x) - x / 2 - (k / 2) * math.log(2) - math.lgamma(k / 2)
+        return math.exp(log_pdf)
+
+    @staticmethod
+    def chi2_cdf(x, k):
+        """CDF Chi-Cuadrado vía gamma incompleta regularizada"""
+        return EstadisticaPura.gamma_inc(k / 2, x / 2)
+
+    @staticmethod
+    def chi2_sf(x, k):
+        """Función de supervivencia Chi-Cuadrado: P(X > x)"""
+        return EstadisticaPura.gamma_inc_sup(k / 2, x / 2)
 
     @staticmethod
     def chi2_ppf(p, k):
-        """Chi2 PPF (Aproximación Wilson-Hilferty)"""
-        # Transforma Chi2 a Normal 
+        """Chi2 PPF (Wilson-Hilferty refinado con Newton sobre la CDF exacta)"""
         if p <= 0: return 0.0
+        if p >= 1: return float('inf')
         z = EstadisticaPura.normal_ppf(p)
-        return k * (1 - 2/(9*k) + z * math.sqrt(2/(9*k))) ** 3
+        x = k * (1 - 2/(9*k) + z * math.sqrt(2/(9*k))) ** 3
+        if x <= 0:
+            # Cola izquierda con k pequeño: P(a, x) ~ x^a / Γ(a+1)
+            x = 2 * math.exp((math.log(p) + math.lgamma(k / 2 + 1)) / (k / 2))
+        return EstadisticaPura._invertir_cdf(
+            lambda t: EstadisticaPura.chi2_cdf(t, k),
+            lambda t: EstadisticaPura.chi2_sf(t, k),
+            lambda t: EstadisticaPura.chi2_pdf(t, k),
+            p, x)
 
     # Discretas
     @staticmethod
@@ -120,15 +309,88 @@ class EstadisticaPura:
     def combinations(n, k):
         return EstadisticaPura.factorial(n) / (EstadisticaPura.factorial(k) * EstadisticaPura.factorial(n - k))
 
+    @staticmethod
+    def binomial_logpmf(k, n, p):
+        """Logaritmo de la PMF binomial (lgamma, sin factoriales)"""
+        if k < 0 or k > n: return float('-inf')
+        if p <= 0: return 0.0 if k == 0 else float('-inf')
+        if p >= 1: return 0.0 if k == n else float('-inf')
+        return (math.lgamma(n + 1) - math.lgamma(k + 1) - math.lgamma(n - k + 1)
+                + k * math.log(p) + (n - k) * math.log1p(-p))
+
     @staticmethod
     def binomial_pmf(k, n, p):
-        if k < 0 or k > n: return 0
-        comb = EstadisticaPura.combinations(n, k)
-        return comb * (p ** k) * ((1 - p) ** (n - k))
-    
+        return math.exp(EstadisticaPura.binomial_logpmf(k, n, p))
+
+    @staticmethod
+    def binomial_cdf(k, n, p):
+        """CDF binomial por recurrencia pmf(k±1) a partir de pmf(k)
+
+        Se suma hacia la cola más corta desde k y se corta cuando los términos
+        ya no cambian el total, así el costo es O(√n) y no O(n·k).
+        """
+        k = math.floor(k)
+        if k < 0: return 0.0
+        if k >= n: return 1.0
+        if p <= 0: return 1.0
+        if p >= 1: return 0.0
+        q = 1 - p
+        if k <= (n + 1) * p:
+            # Cola izquierda: pmf(i-1) = pmf(i) · i/(n-i+1) · q/p
+            term = EstadisticaPura.binomial_pmf(k, n, p)
+            total = term
+            i = k
+            while i > 0 and term > total * 1e-17:
+                term *= i * q / ((n - i + 1) * p)
+                total += term
+                i -= 1
+            return min(total, 1.0)
+        # Cola derecha: pmf(i+1) = pmf(i) · (n-i)/(i+1) · p/q
+        term = EstadisticaPura.binomial_pmf(k + 1, n, p)
+        total = term
+        i = k + 1
+        while i < n and term > total * 1e-17:
+            term *= (n - i) * p / ((i + 1) * q)
+            total += term
+            i += 1
+        return max(1 - total, 0.0)
+
+    @staticmethod
+    def poisson_logpmf(k, lambd):
+        """Logaritmo de la PMF de Poisson"""
+        if k < 0: return float('-inf')
+        if lambd <= 0: return 0.0 if k == 0 else float('-inf')
+        return k * math.log(lambd) - lambd - math.lgamma(k + 1)
+
+    @staticmethod
     def poisson_pmf(k, lambd):
-        if k < 0: return 0
-        return (lambd ** k * math.exp(-lambd)) / EstadisticaPura.factorial(k)
+        return math.exp(EstadisticaPura.poisson_logpmf(k, lambd))
+
+    @staticmethod
+    def poisson_cdf(k, lambd):
+        """CDF de Poisson por recurrencia (misma estrategia que binomial_cdf)"""
+        k = math.floor(k)
+        if k < 0: return 0.0
+        if lambd <= 0: return 1.0
+        if k <= lambd:
+            # Cola izquierda: pmf(i-1) = pmf(i) · i/λ
+            term = EstadisticaPura.poisson_pmf(k, lambd)
+            total = term
+            i = k
+            while i > 0 and term > total * 1e-17:
+                term *= i / lambd
+                total += term
+                i -= 1
+            return min(total, 1.0)
+        # Cola derecha: pmf(i+1) = pmf(i) · λ/(i+1)
+        term = EstadisticaPura.poisson_pmf(k + 1, lambd)
+        total = term
+        i = k + 1
+        while term > total * 1e-17:
+            term *= lambd / (i + 1)
+            total += term
+            i += 1
+        return max(1 - total, 0.0)
     
     @staticmethod
     def exponential_pdf(x, lambd):
@@ -147,40 +409,119 @@ class EstadisticaPura:
     def f_pdf(x, df1, df2):
         """PDF de la distribución F"""
         if x <= 0: return 0
-        try:
-            from math import gamma
-            num = math.sqrt(((df1 * x) ** df1) * (df2 ** df2) / ((df1 * x + df2) ** (df1 + df2)))
-            den = x * (gamma(df1/2) * gamma(df2/2) / gamma((df1 + df2)/2))
-            return num / den
-        except:
-            return 0.0
+        log_beta = math.lgamma(df1/2) + math.lgamma(df2/2) - math.lgamma((df1 + df2)/2)
+        log_pdf = ((df1/2) * math.log(df1 * x) + (df2/2) * math.log(df2)
+                   - ((df1 + df2)/2) * math.log(df1 * x + df2) - math.log(x) - log_beta)
+        return math.exp(log_pdf)
 
     @staticmethod
     def f_cdf(x, df1, df2):
-        """CDF F (Aproximación por integración numérica)"""
-        if x <= 0: return 0
-        # Integración trapezoidal simple
-        dt = 0.01
-        area = 0.0
-        t = 0.001
-        while t < x:
-            area += EstadisticaPura.f_pdf(t, df1, df2) * dt
-            t += dt
-        return min(max(area, 0), 1)
-
-    @staticmethod
-    def f_ppf(p, df1, df2):
-        """F PPF (búsqueda binaria)"""
-        if p <= 0: return 0
+        """CDF F vía beta incompleta regularizada"""
+        if x <= 0: return 0.0
+        den = df1 * x + df2
+        return EstadisticaPura.beta_inc(df1/2, df2/2, df1 * x / den, df2 / den)
+
+    @staticmethod
+    def f_sf(x, df1, df2):
+        """Función de supervivencia F: P(X > x)"""
+        if x <= 0: return 1.0
+        den = df1 * x + df2
+        return EstadisticaPura.beta_inc(df2/2, df1/2, df2 / den, df1 * x / den)
+
+    @staticmethod
+    def f_ppf(p, df1, df2, tol=1e-12, max_iter=100):
+        """F PPF (Newton protegido sobre la CDF exacta, sin tope superior)"""
+        if p <= 0: return 0.0
         if p >= 1: return float('inf')
-        low, high = 0.001, 100
-        for _ in range(100):
-            mid = (low + high) / 2
-            if EstadisticaPura.f_cdf(mid, df1, df2) < p:
-                low = mid
-            else:
-                high = mid
-        return mid
+        x0 = df2 / (df2 - 2) if df2 > 2 else 1.0
+        return EstadisticaPura._invertir_cdf(
+            lambda t: EstadisticaPura.f_cdf(t, df1, df2),
+            lambda t: EstadisticaPura.f_sf(t, df1, df2),
+            lambda t: EstadisticaPura.f_pdf(t, df1, df2),
+            p, x0, tol=tol, max_iter=max_iter)
+
+    # ==========================================
+    # EVALUACIÓN POR LOTES
+    # ==========================================
+    # Aceptan listas, tuplas, array('d') o memoryview y devuelven un arreglo
+    # compacto (array('d') o ndarray). El trabajo lo hace el backend activo.
+    backend = None
+
+    @staticmethod
+    def usar_backend(nombre):
+        """Selecciona el backend de cálculo por lotes ("puro" o "numpy")"""
+        if nombre == "numpy" and np is None:
+            raise ValueError("NumPy no está instalado")
+        EstadisticaPura.backend = BackendNumPy if nombre == "numpy" else BackendPuro
+        return EstadisticaPura.backend.nombre
+
+    @staticmethod
+    def muestrear(dist_id, params, n):
+        return EstadisticaPura.backend.muestrear(dist_id, params, n)
+
+    @staticmethod
+    def normal_pdf_many(xs, mu=0, sigma=1):
+        return EstadisticaPura.backend.normal_pdf_many(xs, mu, sigma)
+
+    @staticmethod
+    def normal_cdf_many(xs, mu=0, sigma=1):
+        return EstadisticaPura.backend.normal_cdf_many(xs, mu, sigma)
+
+    @staticmethod
+    def normal_ppf_many(ps, mu=0, sigma=1):
+        return EstadisticaPura.backend.normal_ppf_many(ps, mu, sigma)
+
+    @staticmethod
+    def t_pdf_many(xs, df):
+        return EstadisticaPura.backend.t_pdf_many(xs, df)
+
+    @staticmethod
+    def t_cdf_many(xs, df):
+        return EstadisticaPura.backend.t_cdf_many(xs, df)
+
+    @staticmethod
+    def chi2_pdf_many(xs, k):
+        return EstadisticaPura.backend.chi2_pdf_many(xs, k)
+
+    @staticmethod
+    def chi2_cdf_many(xs, k):
+        return EstadisticaPura.backend.chi2_cdf_many(xs, k)
+
+    @staticmethod
+    def chi2_ppf_many(ps, k):
+        return EstadisticaPura.backend.chi2_ppf_many(ps, k)
+
+    @staticmethod
+    def f_pdf_many(xs, df1, df2):
+        return EstadisticaPura.backend.f_pdf_many(xs, df1, df2)
+
+    @staticmethod
+    def f_cdf_many(xs, df1, df2):
+        return EstadisticaPura.backend.f_cdf_many(xs, df1, df2)
+
+    @staticmethod
+    def f_ppf_many(ps, df1, df2):
+        return EstadisticaPura.backend.f_ppf_many(ps, df1, df2)
+
+    @staticmethod
+    def exponential_pdf_many(xs, lambd):
+        return EstadisticaPura.backend.exponential_pdf_many(xs, lambd)
+
+    @staticmethod
+    def exponential_cdf_many(xs, lambd):
+        return EstadisticaPura.backend.exponential_cdf_many(xs, lambd)
+
+    @staticmethod
+    def binomial_pmf_many(ks, n, p):
+        return EstadisticaPura.backend.binomial_pmf_many(ks, n, p)
+
+    @staticmethod
+    def poisson_pmf_many(ks, lambd):
+        return EstadisticaPura.backend.poisson_pmf_many(ks, lambd)
+
+    @staticmethod
+    def t_ppf_many(ps, df):
+        return EstadisticaPura.backend.t_ppf_many(ps, df)
 
     # ==========================================
     # DISTRIBUCIONES MUESTRALES
@@ -214,7 +555,7 @@ class EstadisticaPura:
         t = (x_bar - mu) / s_x_bar
         df = n - 1
         prob_menor = EstadisticaPura.t_cdf(t, df)
-        prob_mayor = 1 - prob_menor
+        prob_mayor = EstadisticaPura.t_sf(t, df)
         return {
             "t": t,
             "df": df,
@@ -231,15 +572,8 @@ class EstadisticaPura:
         """
         df = n - 1
         chi2 = (df * s2) / sigma2
-        # Buscar probabilidades
-        prob_menor = 0.0
-        dt = 0.1
-        t = 0.0
-        while t < chi2:
-            prob_menor += EstadisticaPura.chi2_pdf(t, df) * dt
-            t += dt
-        prob_menor = min(max(prob_menor, 0), 1)
-        prob_mayor = 1 - prob_menor
+        prob_menor = EstadisticaPura.chi2_cdf(chi2, df)
+        prob_mayor = EstadisticaPura.chi2_sf(chi2, df)
         return {
             "chi2": chi2,
             "df": df,
@@ -296,7 +630,7 @@ class EstadisticaPura:
         t = (x1_bar - x2_bar) / se
         df = n1 + n2 - 2
         prob_menor = EstadisticaPura.t_cdf(t, df)
-        prob_mayor = 1 - prob_menor
+        prob_mayor = EstadisticaPura.t_sf(t, df)
         return {
             "t": t,
             "df": df,
@@ -335,7 +669,7 @@ class EstadisticaPura:
         df1 = n1 - 1
         df2 = n2 - 1
         prob_menor = EstadisticaPura.f_cdf(f, df1, df2)
-        prob_mayor = 1 - prob_menor
+        prob_mayor = EstadisticaPura.f_sf(f, df1, df2)
         return {
             "f": f,
             "df1": df1,
@@ -385,58 +719,114 @@ class EstadisticaPura:
         upper = df * s2 / chi2_upper
         return {"lower": lower, "upper": upper, "df": df}
 
-    # Gráficos Flet (desactivados - no compatibles con esta versión)
+    # ==========================================
+    # MUESTREO ADAPTATIVO DE CURVAS
+    # ==========================================
+
+    @staticmethod
+    def muestrear_curva(pdf_many, inicio, fin, presupuesto=48, iniciales=13, tol=2e-3):
+        """Puntos (xs, ys) de una curva refinados donde más se curva
+
+        Parte de una malla uniforme de `iniciales` puntos (calculada por
+        índice, sin acumular el paso) y en cada ronda parte por la mitad los
+        intervalos cuyo punto medio se aleja de la cuerda más de
+        tol · altura máxima, empezando por los de mayor error, hasta agotar
+        el `presupuesto` de puntos. Cada ronda evalúa todos los puntos medios
+        nuevos con una sola llamada a `pdf_many`.
+        """
+        iniciales = max(2, min(iniciales, presupuesto))
+        paso = (fin - inicio) / (iniciales - 1)
+        xs = [inicio + i * paso for i in range(iniciales - 1)] + [fin]
+        ys = list(pdf_many(xs))
+        # Punto medio (x, y) de cada intervalo [xs[i], xs[i+1]]
+        xm = [(a + b) / 2 for a, b in zip(xs, xs[1:])]
+        medios = list(zip(xm, pdf_many(xm)))
+        ancho_min = (fin - inicio) * 1e-6
+
+        while len(xs) < presupuesto:
+            escala = max(max(ys), max(y for _, y in medios)) or 1.0
+            errores = []
+            for i, (x, y) in enumerate(medios):
+                if xs[i + 1] - xs[i] > ancho_min:
+                    error = abs(y - (ys[i] + ys[i + 1]) / 2)
+                    if not error <= tol * escala:  # también atrapa inf/nan
+                        errores.append((error if error == error else math.inf, i))
+            if not errores:
+                break
+            errores.sort(reverse=True)
+            elegidos = {i for _, i in errores[:presupuesto - len(xs)]}
+
+            nuevos_xs, nuevos_ys, nuevos_medios, pendientes = [xs[0]], [ys[0]], [], []
+            for i, (x, y) in enumerate(medios):
+                if i in elegidos:
+                    # El punto medio pasa a ser vértice; sus dos mitades necesitan medio nuevo
+                    nuevos_xs.append(x)
+                    nuevos_ys.append(y)
+                    pendientes.append(len(nuevos_medios))
+                    nuevos_medios.append((xs[i] + x) / 2)
+                    pendientes.append(len(nuevos_medios))
+                    nuevos_medios.append((x + xs[i + 1]) / 2)
+                else:
+                    nuevos_medios.append((x, y))
+                nuevos_xs.append(xs[i + 1])
+                nuevos_ys.append(ys[i + 1])
+            valores = pdf_many([nuevos_medios[j] for j in pendientes])
+            for j, y in zip(pendientes, valores):
+                nuevos_medios[j] = (nuevos_medios[j], y)
+            xs, ys, medios = nuevos_xs, nuevos_ys, nuevos_medios
+        return xs, ys
+
+    # Gráficos (paquete flet-charts; en Flet 1.x los charts no vienen en flet)
+    # Cada gráfico separa sus datos (puntos_* / barras_*) del control, para
+    # que GestorGraficos pueda reemplazarlos sin reconstruir el chart
+    @staticmethod
+    def puntos_linea(xs, ys):
+        return [fch.LineChartDataPoint(x, y) for x, y in zip(xs, ys)]
+
+    @staticmethod
+    def puntos_normal(mu, sigma):
+        # Rango: mu - 4sigma a mu + 4sigma
+        return EstadisticaPura.puntos_linea(*EstadisticaPura.muestrear_curva(
+            lambda xs: EstadisticaPura.normal_pdf_many(xs, mu, sigma), mu - 4 * sigma, mu + 4 * sigma))
+
     @staticmethod
     def generar_chart_normal(mu, sigma):
-        data_points = []
-        # Rango: mu - 3sigma a mu + 3sigma
-        start = mu - 4 * sigma
-        end = mu + 4 * sigma
-        step = (end - start) / 50
-        
-        curr = start
-        while curr <= end:
-            y = EstadisticaPura.normal_pdf(curr, mu, sigma)
-            data_points.append(ft.LineChartDataPoint(curr, y))
-            curr += step
+        data_points = EstadisticaPura.puntos_normal(mu, sigma)
             
-        return ft.LineChart(
+        return fch.LineChart(
             data_series=[
-                ft.LineChartData(
-                    data_points=data_points,
-                    color=ft.colors.CYAN,
+                fch.LineChartData(
+                    points=data_points,
+                    color=ft.Colors.CYAN,
                     stroke_width=3,
                     curved=True,
-                    stroke_cap_round=True,
+                    rounded_stroke_cap=True,
                 )
             ],
             border=ft.Border(
-                bottom=ft.BorderSide(2, ft.colors.with_opacity(0.5, ft.colors.ON_SURFACE))
+                bottom=ft.BorderSide(2, ft.Colors.with_opacity(0.5, ft.Colors.ON_SURFACE))
             ),
-            left_axis=ft.ChartAxis(labels_size=0),
-            bottom_axis=ft.ChartAxis(labels_interval=1),
-            tooltip_bgcolor=ft.colors.with_opacity(0.8, ft.colors.blue_grey_900),
+            left_axis=fch.ChartAxis(show_labels=False),
+            bottom_axis=fch.ChartAxis(label_size=32),
+            tooltip=fch.LineChartTooltip(bgcolor=ft.Colors.with_opacity(0.8, ft.Colors.BLUE_GREY_900)),
             min_y=0,
             expand=True
         )
 
+    @staticmethod
+    def puntos_t(df):
+        return EstadisticaPura.puntos_linea(*EstadisticaPura.muestrear_curva(
+            lambda xs: EstadisticaPura.t_pdf_many(xs, df), -4, 4))
+
     @staticmethod
     def generar_chart_t(df):
-        data_points = []
-        start = -4
-        end = 4
-        step = 0.2
-        curr = start
-        while curr <= end:
-             y = EstadisticaPura.t_pdf(curr, df)
-             data_points.append(ft.LineChartDataPoint(curr, y))
-             curr += step
+        data_points = EstadisticaPura.puntos_t(df)
         
-        return ft.LineChart(
+        return fch.LineChart(
              data_series=[
-                ft.LineChartData(
-                    data_points=data_points,
-                    color=ft.colors.ORANGE,
+                fch.LineChartData(
+                    points=data_points,
+                    color=ft.Colors.ORANGE,
                     stroke_width=3,
                     curved=True
                 )
@@ -444,25 +834,23 @@ class EstadisticaPura:
              min_y=0, expand=True
         )
 
+    @staticmethod
+    def puntos_chi2(k):
+        # Para k < 2 la densidad diverge en 0: se empieza en el percentil 1
+        start = 0.0 if k >= 2 else EstadisticaPura.chi2_ppf(0.01, k)
+        end = EstadisticaPura.chi2_ppf(0.999, k)
+        return EstadisticaPura.puntos_linea(*EstadisticaPura.muestrear_curva(
+            lambda xs: EstadisticaPura.chi2_pdf_many(xs, k), start, end))
+
     @staticmethod
     def generar_chart_chi2(k):
-        data_points = []
-        start = 0.1
-        end = k * 2 + 5
-        step = (end - start) / 50
-        curr = start
-        while curr <= end:
-             y = EstadisticaPura.chi2_pdf(curr, k)
-             # Limitar valores muy altos cerca de 0 para df < 2
-             if y > 1.0: y = 1.0 
-             data_points.append(ft.LineChartDataPoint(curr, y))
-             curr += step
+        data_points = EstadisticaPura.puntos_chi2(k)
         
-        return ft.LineChart(
+        return fch.LineChart(
              data_series=[
-                ft.LineChartData(
-                    data_points=data_points,
-                    color=ft.colors.PURPLE,
+                fch.LineChartData(
+                    points=data_points,
+                    color=ft.Colors.PURPLE,
                     stroke_width=3,
                     curved=True
                 )
@@ -471,129 +859,188 @@ class EstadisticaPura:
         )
     
     @staticmethod
-    def generar_chart_binomial(n, p):
-        data_points = []
-        for k in range(int(n) + 1):
-            y = EstadisticaPura.binomial_pmf(k, n, p)
-            data_points.append(
-                ft.BarChartRod(
-                    from_y=0,
-                    to_y=y,
-                    width=20 if n < 15 else 10,
-                    color=ft.colors.GREEN,
-                    tooltip=f"k={k}, P={y:.4f}",
-                    border_radius=4
-                )
+    def cuantil_discreto(cdf, p, lo, hi):
+        """Menor k en [lo, hi] con cdf(k) >= p, por bisección sobre la CDF"""
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if cdf(mid) >= p:
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    @staticmethod
+    def ventana_discreta(cdf, media, sd, k_max=None, cola=1e-5):
+        """Rango [k_ini, k_fin] que deja menos de `cola` de masa a cada lado
+
+        Los extremos se buscan por cuantiles dentro de media ± 8 SD, así que
+        cuesta O(log SD) evaluaciones de la CDF en vez de recorrer cada k.
+        """
+        lo = max(0, math.floor(media - 8 * sd) - 1)
+        hi = math.ceil(media + 8 * sd) + 1
+        if k_max is not None:
+            hi = min(hi, int(k_max))
+        k_ini = EstadisticaPura.cuantil_discreto(cdf, cola, lo, hi)
+        k_fin = EstadisticaPura.cuantil_discreto(cdf, 1 - cola, k_ini, hi)
+        return k_ini, k_fin
+
+    @staticmethod
+    def agrupar_barras(pmf_many, k_ini, k_fin, max_barras):
+        """Lista de (k_desde, k_hasta, probabilidad) con a lo sumo max_barras grupos
+
+        Cada grupo suma la PMF de `ancho` valores consecutivos; con ventanas
+        pequeñas el ancho es 1 y queda una barra por k.
+        """
+        ancho = max(1, -(-(k_fin - k_ini + 1) // max_barras))
+        ps = pmf_many(range(k_ini, k_fin + 1))
+        grupos = []
+        for i in range(0, k_fin - k_ini + 1, ancho):
+            grupos.append((k_ini + i, min(k_ini + i + ancho - 1, k_fin), math.fsum(ps[i:i + ancho])))
+        return grupos
+
+    @staticmethod
+    def generar_barras_discretas(grupos, color, width):
+        """BarChartGroups para los grupos de agrupar_barras"""
+        barras = []
+        for desde, hasta, y in grupos:
+            etiqueta = f"k={desde}" if desde == hasta else f"k={desde}–{hasta}"
+            barras.append(
+                fch.BarChartGroup(x=desde, rods=[
+                    fch.BarChartRod(
+                        from_y=0,
+                        to_y=y,
+                        width=width,
+                        color=color,
+                        tooltip=f"{etiqueta}, P={y:.4f}",
+                        border_radius=4
+                    )
+                ])
             )
+        return barras
+
+    @staticmethod
+    def ancho_barra(ancho, n_barras, max_barras):
+        """Recorta `ancho` al espacio que toca a cada barra, dejando 1/4 de hueco"""
+        espacio = EstadisticaPura.ANCHO_MIN_BARRA * max_barras / max(1, n_barras)
+        return min(ancho, 0.75 * espacio)
+
+    @staticmethod
+    def barras_binomial(n, p, max_barras):
+        n = int(n)
+        k_ini, k_fin = EstadisticaPura.ventana_discreta(
+            lambda k: EstadisticaPura.binomial_cdf(k, n, p), n * p, math.sqrt(n * p * (1 - p)), n)
+        grupos = EstadisticaPura.agrupar_barras(
+            lambda ks: EstadisticaPura.binomial_pmf_many(ks, n, p), k_ini, k_fin, max_barras)
+        return EstadisticaPura.generar_barras_discretas(
+            grupos, ft.Colors.GREEN,
+            EstadisticaPura.ancho_barra(20 if len(grupos) < 15 else 10, len(grupos), max_barras))
+
+    @staticmethod
+    def generar_chart_binomial(n, p, max_barras):
+        grupos = EstadisticaPura.barras_binomial(n, p, max_barras)
         
-        return ft.BarChart(
-            bar_groups=[
-                ft.BarChartGroup(x=i, bar_rods=[rod]) for i, rod in enumerate(data_points)
-            ],
+        return fch.BarChart(
+            groups=grupos,
             border=ft.Border(
-                bottom=ft.BorderSide(2, ft.colors.with_opacity(0.5, ft.colors.ON_SURFACE))
+                bottom=ft.BorderSide(2, ft.Colors.with_opacity(0.5, ft.Colors.ON_SURFACE))
             ),
-            left_axis=ft.ChartAxis(labels_size=0),
-            bottom_axis=ft.ChartAxis(labels_interval=1 if n < 20 else 5),
+            left_axis=fch.ChartAxis(show_labels=False),
+            bottom_axis=fch.ChartAxis(label_spacing=1 if len(grupos) < 20 else 5),
             expand=True
         )
     
     @staticmethod
-    def generar_chart_poisson(lambd):
-        data_points = []
-        end = int(lambd * 3) + 2
-        for k in range(end):
-            y = EstadisticaPura.poisson_pmf(k, lambd)
-            data_points.append(
-                 ft.BarChartRod(
-                    from_y=0,
-                    to_y=y,
-                    width=15,
-                    color=ft.colors.INDIGO,
-                    tooltip=f"k={k}, P={y:.4f}",
-                    border_radius=4
-                )
-            )
-        return ft.BarChart(
-             bar_groups=[
-                ft.BarChartGroup(x=i, bar_rods=[rod]) for i, rod in enumerate(data_points)
-            ],
+    def barras_poisson(lambd, max_barras):
+        k_ini, k_fin = EstadisticaPura.ventana_discreta(
+            lambda k: EstadisticaPura.poisson_cdf(k, lambd), lambd, math.sqrt(lambd))
+        grupos = EstadisticaPura.agrupar_barras(
+            lambda ks: EstadisticaPura.poisson_pmf_many(ks, lambd), k_ini, k_fin, max_barras)
+        return EstadisticaPura.generar_barras_discretas(
+            grupos, ft.Colors.INDIGO, EstadisticaPura.ancho_barra(15, len(grupos), max_barras))
+
+    @staticmethod
+    def generar_chart_poisson(lambd, max_barras):
+        return fch.BarChart(
+            groups=EstadisticaPura.barras_poisson(lambd, max_barras),
             expand=True
         )
 
     @staticmethod
-    def generar_chart_uniforme(a, b):
-        """Genera gráfico para distribución uniforme continua"""
+    def puntos_uniforme(a, b):
         if b <= a:
             b = a + 1  # Evitar división por cero
         height = 1 / (b - a)
         
         # Puntos para crear el rectángulo
         margin = (b - a) * 0.2
-        data_points = [
-            ft.LineChartDataPoint(a - margin, 0),
-            ft.LineChartDataPoint(a, 0),
-            ft.LineChartDataPoint(a, height),
-            ft.LineChartDataPoint(b, height),
-            ft.LineChartDataPoint(b, 0),
-            ft.LineChartDataPoint(b + margin, 0),
+        return [
+            fch.LineChartDataPoint(a - margin, 0),
+            fch.LineChartDataPoint(a, 0),
+            fch.LineChartDataPoint(a, height),
+            fch.LineChartDataPoint(b, height),
+            fch.LineChartDataPoint(b, 0),
+            fch.LineChartDataPoint(b + margin, 0),
         ]
+
+    @staticmethod
+    def generar_chart_uniforme(a, b):
+        """Genera gráfico para distribución uniforme continua"""
+        data_points = EstadisticaPura.puntos_uniforme(a, b)
         
-        return ft.LineChart(
+        return fch.LineChart(
             data_series=[
-                ft.LineChartData(
-                    data_points=data_points,
-                    color=ft.colors.AMBER,
+                fch.LineChartData(
+                    points=data_points,
+                    color=ft.Colors.AMBER,
                     stroke_width=3,
                     curved=False,
-                    stroke_cap_round=True,
+                    rounded_stroke_cap=True,
                 )
             ],
             border=ft.Border(
-                bottom=ft.BorderSide(2, ft.colors.with_opacity(0.5, ft.colors.ON_SURFACE))
+                bottom=ft.BorderSide(2, ft.Colors.with_opacity(0.5, ft.Colors.ON_SURFACE))
             ),
-            left_axis=ft.ChartAxis(labels_size=0),
-            bottom_axis=ft.ChartAxis(labels_interval=1),
-            tooltip_bgcolor=ft.colors.with_opacity(0.8, ft.colors.blue_grey_900),
+            left_axis=fch.ChartAxis(show_labels=False),
+            bottom_axis=fch.ChartAxis(label_size=32),
+            tooltip=fch.LineChartTooltip(bgcolor=ft.Colors.with_opacity(0.8, ft.Colors.BLUE_GREY_900)),
             min_y=0,
             expand=True
         )
 
+    @staticmethod
+    def puntos_exponencial(lambd):
+        end = 5 / lambd if lambd > 0 else 5
+        return EstadisticaPura.puntos_linea(*EstadisticaPura.muestrear_curva(
+            lambda xs: EstadisticaPura.exponential_pdf_many(xs, lambd), 0.0, end))
+
     @staticmethod
     def generar_chart_exponencial(lambd):
         """Genera gráfico para distribución exponencial"""
-        data_points = []
-        end = 5 / lambd if lambd > 0 else 5
-        step = end / 50
-        
-        curr = 0
-        while curr <= end:
-            y = EstadisticaPura.exponential_pdf(curr, lambd)
-            data_points.append(ft.LineChartDataPoint(curr, y))
-            curr += step
+        data_points = EstadisticaPura.puntos_exponencial(lambd)
         
-        return ft.LineChart(
+        return fch.LineChart(
             data_series=[
-                ft.LineChartData(
-                    data_points=data_points,
-                    color=ft.colors.PINK,
+                fch.LineChartData(
+                    points=data_points,
+                    color=ft.Colors.PINK,
                     stroke_width=3,
                     curved=True,
-                    stroke_cap_round=True,
+                    rounded_stroke_cap=True,
                 )
             ],
             border=ft.Border(
-                bottom=ft.BorderSide(2, ft.colors.with_opacity(0.5, ft.colors.ON_SURFACE))
+                bottom=ft.BorderSide(2, ft.Colors.with_opacity(0.5, ft.Colors.ON_SURFACE))
             ),
-            left_axis=ft.ChartAxis(labels_size=0),
-            bottom_axis=ft.ChartAxis(labels_interval=1),
-            tooltip_bgcolor=ft.colors.with_opacity(0.8, ft.colors.blue_grey_900),
+            left_axis=fch.ChartAxis(show_labels=False),
+            bottom_axis=fch.ChartAxis(label_size=32),
+            tooltip=fch.LineChartTooltip(bgcolor=ft.Colors.with_opacity(0.8, ft.Colors.BLUE_GREY_900)),
             min_y=0,
             expand=True
         )
 
     @staticmethod
-    def generar_grafico_dispatch(dist_id, params):
+    def generar_grafico_dispatch(dist_id, params, max_barras):
+        """Chart de la distribución; las discretas usan a lo sumo max_barras barras"""
         if dist_id == "normal":
              return EstadisticaPura.generar_chart_normal(params[0], params[1])
         elif dist_id == "uniforme":
@@ -601,9 +1048,9 @@ class EstadisticaPura:
         elif dist_id == "exponencial":
              return EstadisticaPura.generar_chart_exponencial(params[0])
         elif dist_id == "binomial":
-             return EstadisticaPura.generar_chart_binomial(params[0], params[1])
+             return EstadisticaPura.generar_chart_binomial(params[0], params[1], max_barras)
         elif dist_id == "poisson":
-             return EstadisticaPura.generar_chart_poisson(params[0])
+             return EstadisticaPura.generar_chart_poisson(params[0], max_barras)
         elif dist_id == "t_student":
              return EstadisticaPura.generar_chart_t(params[0])
         elif dist_id == "chi_cuadrado":
@@ -611,3 +1058,2071 @@ class EstadisticaPura:
         else:
              return ft.Text("Gráfico no disponible", color="red")
 
+    @staticmethod
+    def generar_datos_dispatch(dist_id, params, max_barras):
+        """Solo los puntos (LineChart) o grupos (BarChart) del gráfico, sin el control"""
+        if dist_id == "normal":
+             return EstadisticaPura.puntos_normal(params[0], params[1])
+        elif dist_id == "uniforme":
+             return EstadisticaPura.puntos_uniforme(params[0], params[1])
+        elif dist_id == "exponencial":
+             return EstadisticaPura.puntos_exponencial(params[0])
+        elif dist_id == "binomial":
+             return EstadisticaPura.barras_binomial(params[0], params[1], max_barras)
+        elif dist_id == "poisson":
+             return EstadisticaPura.barras_poisson(params[0], max_barras)
+        elif dist_id == "t_student":
+             return EstadisticaPura.puntos_t(params[0])
+        elif dist_id == "chi_cuadrado":
+             return EstadisticaPura.puntos_chi2(params[0])
+        return None
+
+
+# ==========================================
+# 2. BACKENDS DE CÁLCULO POR LOTES
+# ==========================================
+class BackendPuro:
+    """Evaluación por lotes con math puro (el que se empaqueta en el APK)"""
+    nombre = "puro"
+
+    @staticmethod
+    def t_ppf_many(ps, df):
+        """t-Student PPF para un vector de probabilidades
+
+        `df` puede ser un escalar o una secuencia del mismo largo que `ps`.
+        Las constantes de Hill se calculan una sola vez por cada gl distinto
+        y cada valor se pule con Newton sobre la CDF exacta.
+        """
+        dfs = [df] * len(ps) if isinstance(df, (int, float)) else df
+        constantes = {}
+        res = array('d')
+        for p, n in zip(ps, dfs):
+            if p <= 0:
+                res.append(float('-inf'))
+                continue
+            if p >= 1:
+                res.append(float('inf'))
+                continue
+            if p == 0.5:
+                res.append(0.0)
+                continue
+            cola = min(p, 1 - p)
+            if n not in constantes:
+                a = 1 / (n - 0.5) if n > 1 else 0.0
+                b = 48 / (a * a) if a else 0.0
+                c = ((20700 * a / b - 98) * a - 16) * a + 96.36 if a else 0.0
+                d = ((94.5 / (b + c) - 3) / b + 1) * math.sqrt(a * math.pi / 2) * n if a else 0.0
+                constantes[n] = (a, b, c, d)
+            x0 = EstadisticaPura._t_hill(2 * cola, n, constantes[n])
+            # Se resuelve la cola superior (t >= 0) y se aplica la simetría
+            t = EstadisticaPura._invertir_cdf(
+                lambda t: EstadisticaPura.t_cdf(t, n),
+                lambda t: EstadisticaPura.t_sf(t, n),
+                lambda t: EstadisticaPura.t_pdf(t, n),
+                1 - cola, x0, q=cola)
+            res.append(t if p > 0.5 else -t)
+        return res
+
+    @staticmethod
+    def normal_pdf_many(xs, mu=0, sigma=1):
+        c = 1 / (sigma * math.sqrt(2 * math.pi))
+        inv = 1 / sigma
+        exp = math.exp
+        return array('d', (c * exp(-0.5 * ((x - mu) * inv) ** 2) for x in xs))
+
+    @staticmethod
+    def normal_cdf_many(xs, mu=0, sigma=1):
+        inv = 1 / (sigma * math.sqrt(2))
+        erfc = math.erfc
+        # Con erfc la cola izquierda no se cancela a 0 como con 1 + erf
+        return array('d', (0.5 * erfc(-(x - mu) * inv) for x in xs))
+
+    @staticmethod
+    def normal_ppf_many(ps, mu=0, sigma=1):
+        ppf = EstadisticaPura.normal_ppf
+        return array('d', (ppf(p, mu, sigma) for p in ps))
+
+    @staticmethod
+    def t_pdf_many(xs, df):
+        log_c = math.lgamma((df + 1) / 2) - math.lgamma(df / 2) - 0.5 * math.log(df * math.pi)
+        e = -(df + 1) / 2
+        exp, log1p = math.exp, math.log1p
+        return array('d', (exp(log_c + e * log1p(x * x / df)) for x in xs))
+
+    @staticmethod
+    def t_cdf_many(xs, df):
+        cdf = EstadisticaPura.t_cdf
+        return array('d', (cdf(x, df) for x in xs))
+
+    @staticmethod
+    def chi2_pdf_many(xs, k):
+        a = k / 2 - 1
+        log_c = -(k / 2) * math.log(2) - math.lgamma(k / 2)
+        exp, log = math.exp, math.log
+        return array('d', (exp(a * log(x) - x / 2 + log_c) if x > 0 else 0.0 for x in xs))
+
+    @staticmethod
+    def chi2_cdf_many(xs, k):
+        gamma_inc = EstadisticaPura.gamma_inc
+        return array('d', (gamma_inc(k / 2, x / 2) for x in xs))
+
+    @staticmethod
+    def chi2_ppf_many(ps, k):
+        ppf = EstadisticaPura.chi2_ppf
+        return array('d', (ppf(p, k) for p in ps))
+
+    @staticmethod
+    def f_pdf_many(xs, df1, df2):
+        log_beta = math.lgamma(df1/2) + math.lgamma(df2/2) - math.lgamma((df1 + df2)/2)
+        log_c = (df1/2) * math.log(df1) + (df2/2) * math.log(df2) - log_beta
+        a, b = df1/2 - 1, -(df1 + df2)/2
+        exp, log = math.exp, math.log
+        return array('d', (exp(log_c + a * log(x) + b * log(df1 * x + df2)) if x > 0 else 0.0
+                           for x in xs))
+
+    @staticmethod
+    def f_cdf_many(xs, df1, df2):
+        cdf = EstadisticaPura.f_cdf
+        return array('d', (cdf(x, df1, df2) for x in xs))
+
+    @staticmethod
+    def f_ppf_many(ps, df1, df2):
+        ppf = EstadisticaPura.f_ppf
+        return array('d', (ppf(p, df1, df2) for p in ps))
+
+    @staticmethod
+    def exponential_pdf_many(xs, lambd):
+        exp = math.exp
+        return array('d', (lambd * exp(-lambd * x) if x >= 0 else 0.0 for x in xs))
+
+    @staticmethod
+    def exponential_cdf_many(xs, lambd):
+        expm1 = math.expm1
+        return array('d', (-expm1(-lambd * x) if x >= 0 else 0.0 for x in xs))
+
+    @staticmethod
+    def binomial_pmf_many(ks, n, p):
+        if p <= 0 or p >= 1:
+            pmf = EstadisticaPura.binomial_pmf
+            return array('d', (pmf(k, n, p) for k in ks))
+        log_n = math.lgamma(n + 1)
+        log_p, log_q = math.log(p), math.log1p(-p)
+        exp, lgamma = math.exp, math.lgamma
+        return array('d', (exp(log_n - lgamma(k + 1) - lgamma(n - k + 1) + k * log_p + (n - k) * log_q)
+                           if 0 <= k <= n else 0.0 for k in ks))
+
+    @staticmethod
+    def poisson_pmf_many(ks, lambd):
+        if lambd <= 0:
+            pmf = EstadisticaPura.poisson_pmf
+            return array('d', (pmf(k, lambd) for k in ks))
+        log_l = math.log(lambd)
+        exp, lgamma = math.exp, math.lgamma
+        return array('d', (exp(k * log_l - lambd - lgamma(k + 1)) if k >= 0 else 0.0 for k in ks))
+
+    @staticmethod
+    def generador(semilla=None):
+        return random.Random(semilla)
+
+    @staticmethod
+    def muestreador(dist_id, params, rng=random):
+        """Función m -> array('d') con m valores; la distribución se resuelve una sola vez
+
+        Las distribuciones sin generador dan 0.0.
+        """
+        if dist_id == "normal":
+            mu, sigma = params[0], params[1]
+            gauss = rng.gauss
+            return lambda m: array('d', [gauss(mu, sigma) for _ in range(m)])
+        if dist_id == "exponencial":
+            lambd = params[0]
+            expovariate = rng.expovariate
+            return lambda m: array('d', [expovariate(lambd) for _ in range(m)])
+        if dist_id == "uniforme":
+            a, b = params[0], params[1]
+            uniform = rng.uniform
+            return lambda m: array('d', [uniform(a, b) for _ in range(m)])
+        if dist_id == "poisson":
+            return BackendPuro.muestreador_poisson(params[0], rng)
+        if dist_id == "binomial":
+            return BackendPuro.muestreador_binomial(params[0], params[1], rng)
+        if dist_id == "chi_cuadrado":
+            # χ²(k) = Gamma(k/2, escala 2); gammavariate es de rechazo, O(1)
+            forma = params[0] / 2
+            gammavariate = rng.gammavariate
+            return lambda m: array('d', [gammavariate(forma, 2.0) for _ in range(m)])
+        if dist_id == "t_student":
+            # T = Z / √(χ²(ν)/ν)
+            df = params[0]
+            forma, gauss, gammavariate, sqrt = df / 2, rng.gauss, rng.gammavariate, math.sqrt
+            return lambda m: array('d', [gauss(0.0, 1.0) / sqrt(gammavariate(forma, 2.0) / df)
+                                         for _ in range(m)])
+        if dist_id == "fisher_f":
+            # F = (χ²(d1)/d1) / (χ²(d2)/d2)
+            df1, df2 = params[0], params[1]
+            f1, f2, gammavariate = df1 / 2, df2 / 2, rng.gammavariate
+            return lambda m: array('d', [(gammavariate(f1, 2.0) / df1) / (gammavariate(f2, 2.0) / df2)
+                                         for _ in range(m)])
+        return lambda m: array('d', bytes(8 * m))
+
+    @staticmethod
+    def muestreador_binomial(n, p, rng=random):
+        """Binomial con costo esperado O(1) por valor
+
+        Se trabaja con p' = min(p, 1 - p) y se refleja al final. Si n·p' < 10
+        se invierte la CDF desde k = 0 (recurrencia de la PMF); si no, se usa
+        el rechazo transformado BTRS de Hörmann (1993), con las constantes
+        y el modo precalculados.
+        """
+        n = int(n)
+        aleatorio = rng.random
+        if p <= 0 or n <= 0:
+            return lambda m: array('d', bytes(8 * m))
+        if p >= 1:
+            return lambda m: array('d', [n] * m)
+        reflejar = p > 0.5
+        p = min(p, 1 - p)
+        q = 1 - p
+
+        if n * p < 10:
+            p0 = math.exp(n * math.log1p(-p))
+            razon = p / q
+
+            def bloque(m):
+                res = array('d', bytes(8 * m))
+                for i in range(m):
+                    u = aleatorio()
+                    k, pk = 0, p0
+                    while u > pk and k < n:
+                        u -= pk
+                        k += 1
+                        pk *= razon * (n - k + 1) / k
+                    res[i] = n - k if reflejar else k
+                return res
+            return bloque
+
+        spq = math.sqrt(n * p * q)
+        b = 1.15 + 2.53 * spq
+        a = -0.0873 + 0.0248 * b + 0.01 * p
+        c = n * p + 0.5
+        v_r = 0.92 - 4.2 / b
+        alpha = (2.83 + 5.1 / b) * spq
+        lpq = math.log(p / q)
+        moda = math.floor((n + 1) * p)
+        h = math.lgamma(moda + 1) + math.lgamma(n - moda + 1)
+        floor, log, lgamma = math.floor, math.log, math.lgamma
+
+        def bloque(m):
+            res = array('d', bytes(8 * m))
+            for i in range(m):
+                while True:
+                    u = aleatorio() - 0.5
+                    v = aleatorio()
+                    us = 0.5 - abs(u)
+                    k = floor((2 * a / us + b) * u + c)
+                    if k < 0 or k > n:
+                        continue
+                    # Región de aceptación inmediata
+                    if us >= 0.07 and v <= v_r:
+                        break
+                    if log(v * alpha / (a / (us * us) + b)) <= h - lgamma(k + 1) - lgamma(n - k + 1) + (k - moda) * lpq:
+                        break
+                res[i] = n - k if reflejar else k
+            return res
+        return bloque
+
+    @staticmethod
+    def muestreador_poisson(lambd, rng=random):
+        """Poisson con costo esperado O(1) por valor
+
+        Para λ < 10 se invierte la CDF sumando la PMF por recurrencia
+        (a lo sumo unas pocas decenas de pasos). Para λ >= 10 se usa el
+        rechazo transformado PTRS de Hörmann (1993), con constantes
+        precalculadas por λ y una tasa de aceptación mayor a 0.9.
+        """
+        aleatorio = rng.random
+        if lambd <= 0:
+            return lambda m: array('d', bytes(8 * m))
+        if lambd < 10:
+            p0 = math.exp(-lambd)
+
+            def bloque(m):
+                res = array('d', bytes(8 * m))
+                for i in range(m):
+                    u = aleatorio()
+                    k, p = 0, p0
+                    while u > p and k < 200:
+                        u -= p
+                        k += 1
+                        p *= lambd / k
+                    res[i] = k
+                return res
+            return bloque
+
+        log_l = math.log(lambd)
+        b = 0.931 + 2.53 * math.sqrt(lambd)
+        a = -0.059 + 0.02483 * b
+        log_inv_alpha = math.log(1.1239 + 1.1328 / (b - 3.4))
+        v_r = 0.9277 - 3.6224 / (b - 2)
+        floor, log, lgamma = math.floor, math.log, math.lgamma
+
+        def bloque(m):
+            res = array('d', bytes(8 * m))
+            for i in range(m):
+                while True:
+                    u = aleatorio() - 0.5
+                    v = aleatorio()
+                    us = 0.5 - abs(u)
+                    k = floor((2 * a / us + b) * u + lambd + 0.43)
+                    # Región de aceptación inmediata (la gran mayoría de los casos)
+                    if us >= 0.07 and v <= v_r:
+                        break
+                    if k < 0 or (us < 0.013 and v > us):
+                        continue
+                    if log(v) + log_inv_alpha - log(a / (us * us) + b) <= -lambd + k * log_l - lgamma(k + 1):
+                        break
+                res[i] = k
+            return res
+        return bloque
+
+    @staticmethod
+    def muestrear(dist_id, params, n, rng=random):
+        """n valores aleatorios; las distribuciones sin generador dan 0.0"""
+        return BackendPuro.muestreador(dist_id, params, rng)(n)
+
+
+class BackendNumPy:
+    """Evaluación por lotes vectorizada con NumPy (servidores Linux)
+
+    NumPy no trae erf, lgamma ni funciones incompletas, así que aquí se
+    vectorizan las mismas series y fracciones continuas del backend puro.
+    """
+    nombre = "numpy"
+
+    @staticmethod
+    def _arr(xs):
+        return np.asarray(xs, dtype=float)
+
+    @staticmethod
+    def _lgamma(x):
+        """lgamma vectorizado: recurrencia hasta x >= 8 y serie de Stirling"""
+        z = np.array(x, dtype=float)
+        corr = np.zeros_like(z)
+        for _ in range(8):
+            chico = z < 8
+            corr -= np.log(np.where(chico, z, 1.0))
+            z = np.where(chico, z + 1, z)
+        zi = 1 / z
+        zi2 = zi * zi
+        serie = zi * (1/12 - zi2 * (1/360 - zi2 * (1/1260 - zi2 * (1/1680 - zi2 * (1/1188 - zi2 * 691/360360)))))
+        return (z - 0.5) * np.log(z) - z + 0.5 * math.log(2 * math.pi) + serie + corr
+
+    @staticmethod
+    def _gamma_pq(a, x):
+        """(P(a, x), Q(a, x)) con la misma partición serie / fracción continua"""
+        x = np.asarray(x, dtype=float)
+        p = np.zeros_like(x)
+        q = np.ones_like(x)
+        pos = x > 0
+        serie = pos & (x < a + 1)
+        frac = pos & ~serie
+        iteraciones = 200 + int(10 * math.sqrt(a))
+        if serie.any():
+            xs = x[serie]
+            ap = np.full_like(xs, a)
+            term = np.full_like(xs, 1.0 / a)
+            total = term.copy()
+            for _ in range(iteraciones):
+                ap += 1
+                term *= xs / ap
+                total += term
+                if np.all(np.abs(term) < np.abs(total) * 1e-16):
+                    break
+            ps = total * np.exp(-xs + a * np.log(xs) - math.lgamma(a))
+            p[serie] = ps
+            q[serie] = 1 - ps
+        if frac.any():
+            xf = x[frac]
+            tiny = 1e-300
+            b = xf + 1 - a
+            c = np.full_like(xf, 1 / tiny)
+            d = 1 / b
+            h = d.copy()
+            for i in range(1, iteraciones + 1):
+                an = -i * (i - a)
+                b = b + 2
+                d = an * d + b
+                d = np.where(np.abs(d) < tiny, tiny, d)
+                c = b + an / c
+                c = np.where(np.abs(c) < tiny, tiny, c)
+                d = 1 / d
+                delta = d * c
+                h *= delta
+                if np.all(np.abs(delta - 1) < 1e-15):
+                    break
+            qs = np.exp(-xf + a * np.log(xf) - math.lgamma(a)) * h
+            q[frac] = qs
+            p[frac] = 1 - qs
+        return p, q
+
+    @staticmethod
+    def _beta_cf(a, b, x):
+        tiny = 1e-300
+        qab, qap, qam = a + b, a + 1, a - 1
+        c = np.ones_like(x)
+        d = 1 - qab * x / qap
+        d = 1 / np.where(np.abs(d) < tiny, tiny, d)
+        h = d.copy()
+        for m in range(1, 301):
+            m2 = 2 * m
+            for aa in (m * (b - m) * x / ((qam + m2) * (a + m2)),
+                       -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))):
+                d = 1 + aa * d
+                d = 1 / np.where(np.abs(d) < tiny, tiny, d)
+                c = 1 + aa / c
+                c = np.where(np.abs(c) < tiny, tiny, c)
+                delta = d * c
+                h *= delta
+            if np.all(np.abs(delta - 1) < 1e-15):
+                break
+        return h
+
+    @staticmethod
+    def _beta_inc(a, b, x, y):
+        """I_x(a, b) vectorizado; y = 1 - x calculado por quien llama
+
+        `a` y `b` pueden ser escalares o arreglos del mismo largo que `x`.
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        res = np.where(y <= 0, 1.0, 0.0)
+        interior = (x > 0) & (y > 0)
+        if np.ndim(a) == 0 and np.ndim(b) == 0:
+            log_b = math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+        else:
+            a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float), x)[:2]
+            log_b = BackendNumPy._lgamma(a + b) - BackendNumPy._lgamma(a) - BackendNumPy._lgamma(b)
+        directo = interior & (x < (a + 1) / (a + b + 2))
+        simetrico = interior & ~directo
+
+        def sel(v, mascara):
+            return v[mascara] if np.ndim(v) else v
+
+        if directo.any():
+            xd, yd = x[directo], y[directo]
+            ad, bd = sel(a, directo), sel(b, directo)
+            front = np.exp(sel(log_b, directo) + ad * np.log(xd) + bd * np.log(yd))
+            res[directo] = front * BackendNumPy._beta_cf(ad, bd, xd) / ad
+        if simetrico.any():
+            xs, ys = x[simetrico], y[simetrico]
+            as_, bs = sel(a, simetrico), sel(b, simetrico)
+            front = np.exp(sel(log_b, simetrico) + as_ * np.log(xs) + bs * np.log(ys))
+            res[simetrico] = 1 - front * BackendNumPy._beta_cf(bs, as_, ys) / bs
+        return res
+
+    @staticmethod
+    def _invertir(cdf, sf, pdf, p, x0, lo=0.0, tol=1e-13, max_iter=100, q=None):
+        """Versión vectorizada de EstadisticaPura._invertir_cdf
+
+        `cdf`, `sf` y `pdf` reciben (x, idx): los valores a evaluar y sus
+        posiciones en el arreglo original, para quien tenga parámetros por
+        elemento. Cada vuelta evalúa solo los elementos que aún no
+        convergieron, y de cada uno solo la cola que necesita.
+        """
+        x = np.array(x0, dtype=float)
+        forma = x.shape
+        x = x.ravel()
+        p = np.broadcast_to(np.asarray(p, dtype=float), forma).ravel()
+        q = 1 - p if q is None else np.broadcast_to(np.asarray(q, dtype=float), forma).ravel()
+        lo = np.full_like(x, lo)
+        hi = np.full_like(x, np.inf)
+        idx = np.arange(x.size)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for _ in range(max_iter):
+                if not idx.size:
+                    break
+                xi, pi = x[idx], p[idx]
+                superior = pi > 0.5
+                error = np.empty_like(xi)
+                if superior.any():
+                    error[superior] = q[idx[superior]] - sf(xi[superior], idx[superior])
+                if not superior.all():
+                    inferior = ~superior
+                    error[inferior] = cdf(xi[inferior], idx[inferior]) - pi[inferior]
+                hi_i = np.where(error > 0, xi, hi[idx])
+                lo_i = np.where(error <= 0, xi, lo[idx])
+                hi[idx], lo[idx] = hi_i, lo_i
+                densidad = pdf(xi, idx)
+                x_nuevo = np.where(densidad > 0, xi - error / densidad, lo_i)
+                fuera = ~((lo_i < x_nuevo) & (x_nuevo < hi_i))
+                x_nuevo = np.where(fuera, np.where(np.isinf(hi_i), 2 * xi + 1, (lo_i + hi_i) / 2), x_nuevo)
+                x_nuevo = np.where(error == 0, xi, x_nuevo)
+                x[idx] = x_nuevo
+                idx = idx[np.abs(x_nuevo - xi) > tol * np.abs(xi)]
+        return x.reshape(forma)
+
+    @staticmethod
+    def normal_pdf_many(xs, mu=0, sigma=1):
+        z = (BackendNumPy._arr(xs) - mu) / sigma
+        return np.exp(-0.5 * z * z) / (sigma * math.sqrt(2 * math.pi))
+
+    @staticmethod
+    def normal_cdf_many(xs, mu=0, sigma=1):
+        z = (BackendNumPy._arr(xs) - mu) / sigma
+        # erfc(|z|/√2) = Q(1/2, z²/2); se usa Q para no perder la cola izquierda
+        _, q = BackendNumPy._gamma_pq(0.5, z * z / 2)
+        return np.where(z < 0, 0.5 * q, 1 - 0.5 * q)
+
+    @staticmethod
+    def normal_ppf_many(ps, mu=0, sigma=1):
+        p = BackendNumPy._arr(ps)
+        a1, a2, a3, a4, a5, a6 = EstadisticaPura._ACKLAM_A
+        b1, b2, b3, b4, b5 = EstadisticaPura._ACKLAM_B
+        c1, c2, c3, c4, c5, c6 = EstadisticaPura._ACKLAM_C
+        d1, d2, d3, d4 = EstadisticaPura._ACKLAM_D
+        q = np.minimum(p, 1 - p)
+        central = q > 0.02425
+        u = q - 0.5
+        r = u * u
+        z_central = (((((a1 * r + a2) * r + a3) * r + a4) * r + a5) * r + a6) * u / (((((b1 * r + b2) * r + b3) * r + b4) * r + b5) * r + 1)
+        r = np.sqrt(-2 * np.log(np.where(central | (q <= 0), 0.5, q)))
+        z_cola = (((((c1 * r + c2) * r + c3) * r + c4) * r + c5) * r + c6) / ((((d1 * r + d2) * r + d3) * r + d4) * r + 1)
+        z = np.where(central, z_central, z_cola)
+        z = np.where(p > 0.5, -z, z)
+        z = np.where(p <= 0, -np.inf, z)
+        z = np.where(p >= 1, np.inf, z)
+        return mu + sigma * z
+
+    @staticmethod
+    def t_pdf_many(xs, df):
+        """`df` puede ser un escalar o un arreglo del mismo largo que `xs`"""
+        x = BackendNumPy._arr(xs)
+        if np.ndim(df) == 0:
+            log_c = math.lgamma((df + 1) / 2) - math.lgamma(df / 2) - 0.5 * math.log(df * math.pi)
+        else:
+            df = BackendNumPy._arr(df)
+            lgamma = BackendNumPy._lgamma
+            log_c = lgamma((df + 1) / 2) - lgamma(df / 2) - 0.5 * np.log(df * math.pi)
+        return np.exp(log_c - (df + 1) / 2 * np.log1p(x * x / df))
+
+    @staticmethod
+    def t_cdf_many(xs, df):
+        """`df` puede ser un escalar o un arreglo del mismo largo que `xs`"""
+        x = BackendNumPy._arr(xs)
+        if np.ndim(df):
+            df = BackendNumPy._arr(df)
+        x2 = x * x
+        cola = 0.5 * BackendNumPy._beta_inc(df / 2, 0.5, df / (df + x2), x2 / (df + x2))
+        return np.where(x > 0, 1 - cola, cola)
+
+    @staticmethod
+    def t_ppf_many(ps, df):
+        p = BackendNumPy._arr(ps)
+        n = np.array(np.broadcast_to(BackendNumPy._arr(df), p.shape))
+        cola = np.clip(np.minimum(p, 1 - p), 1e-300, 0.5)
+        # Arranque de Cornish-Fisher (o, en la cola lejana, de la asíntota
+        # P(T > t) ≈ C·t^(-n)) y una sola iteración protegida para todos los
+        # gl a la vez (cada elemento lleva su propio gl)
+        z = -BackendNumPy.normal_ppf_many(cola)
+        x0 = z + (z**3 + z) / (4 * n) + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * n * n)
+        lgamma = BackendNumPy._lgamma
+        log_c = lgamma((n + 1) / 2) - lgamma(n / 2) - 0.5 * np.log(n * math.pi) + (n - 1) / 2 * np.log(n)
+        with np.errstate(over='ignore'):
+            x_cola = np.exp((log_c - np.log(n) - np.log(cola)) / n)
+        x0 = np.maximum(x0, 1e-3)
+        # La asíntota vale con t² >> n; se usa solo si Cornish-Fisher quedó
+        # antes de la raíz (desde ahí Newton avanza muy lento en la cola)
+        candidatos = np.flatnonzero((x_cola * x_cola > 10 * n) & (x_cola > x0))
+        if candidatos.size:
+            corto = BackendNumPy.t_cdf_many(-x0[candidatos], n[candidatos]) > cola[candidatos]
+            x0[candidatos[corto]] = x_cola[candidatos[corto]]
+        t = BackendNumPy._invertir(
+            lambda t, i: BackendNumPy.t_cdf_many(t, n[i]),
+            lambda t, i: BackendNumPy.t_cdf_many(-t, n[i]),
+            lambda t, i: BackendNumPy.t_pdf_many(t, n[i]),
+            1 - cola, x0, q=cola)
+        res = np.where(p > 0.5, t, -t)
+        res = np.where(cola == 0.5, 0.0, res)
+        res = np.where(p <= 0, -np.inf, res)
+        return np.where(p >= 1, np.inf, res)
+
+    @staticmethod
+    def chi2_pdf_many(xs, k):
+        x = BackendNumPy._arr(xs)
+        pos = x > 0
+        xp = np.where(pos, x, 1.0)
+        log_pdf = (k / 2 - 1) * np.log(xp) - xp / 2 - (k / 2) * math.log(2) - math.lgamma(k / 2)
+        return np.where(pos, np.exp(log_pdf), 0.0)
+
+    @staticmethod
+    def chi2_cdf_many(xs, k):
+        p, _ = BackendNumPy._gamma_pq(k / 2, BackendNumPy._arr(xs) / 2)
+        return p
+
+    @staticmethod
+    def chi2_ppf_many(ps, k):
+        p = BackendNumPy._arr(ps)
+        z = BackendNumPy.normal_ppf_many(p)
+        x0 = k * (1 - 2/(9*k) + z * math.sqrt(2/(9*k))) ** 3
+        with np.errstate(divide='ignore'):
+            x_chico = 2 * np.exp((np.log(p) + math.lgamma(k / 2 + 1)) / (k / 2))
+        x0 = np.where(x0 > 0, x0, x_chico)
+        x = BackendNumPy._invertir(
+            lambda t, _: BackendNumPy._gamma_pq(k / 2, t / 2)[0],
+            lambda t, _: BackendNumPy._gamma_pq(k / 2, t / 2)[1],
+            lambda t, _: BackendNumPy.chi2_pdf_many(t, k),
+            p, x0)
+        x = np.where(p <= 0, 0.0, x)
+        return np.where(p >= 1, np.inf, x)
+
+    @staticmethod
+    def f_pdf_many(xs, df1, df2):
+        x = BackendNumPy._arr(xs)
+        pos = x > 0
+        xp = np.where(pos, x, 1.0)
+        log_beta = math.lgamma(df1/2) + math.lgamma(df2/2) - math.lgamma((df1 + df2)/2)
+        log_pdf = ((df1/2) * np.log(df1 * xp) + (df2/2) * math.log(df2)
+                   - ((df1 + df2)/2) * np.log(df1 * xp + df2) - np.log(xp) - log_beta)
+        return np.where(pos, np.exp(log_pdf), 0.0)
+
+    @staticmethod
+    def f_cdf_many(xs, df1, df2):
+        x = np.maximum(BackendNumPy._arr(xs), 0.0)
+        den = df1 * x + df2
+        return BackendNumPy._beta_inc(df1/2, df2/2, df1 * x / den, df2 / den)
+
+    @staticmethod
+    def f_sf_many(xs, df1, df2):
+        x = np.maximum(BackendNumPy._arr(xs), 0.0)
+        den = df1 * x + df2
+        return BackendNumPy._beta_inc(df2/2, df1/2, df2 / den, df1 * x / den)
+
+    @staticmethod
+    def f_ppf_many(ps, df1, df2):
+        p = BackendNumPy._arr(ps)
+        x0 = np.full_like(p, df2 / (df2 - 2) if df2 > 2 else 1.0)
+        x = BackendNumPy._invertir(
+            lambda t, _: BackendNumPy.f_cdf_many(t, df1, df2),
+            lambda t, _: BackendNumPy.f_sf_many(t, df1, df2),
+            lambda t, _: BackendNumPy.f_pdf_many(t, df1, df2),
+            p, x0, tol=1e-12)
+        x = np.where(p <= 0, 0.0, x)
+        return np.where(p >= 1, np.inf, x)
+
+    @staticmethod
+    def exponential_pdf_many(xs, lambd):
+        x = BackendNumPy._arr(xs)
+        return np.where(x >= 0, lambd * np.exp(-lambd * np.maximum(x, 0)), 0.0)
+
+    @staticmethod
+    def exponential_cdf_many(xs, lambd):
+        x = BackendNumPy._arr(xs)
+        return np.where(x >= 0, -np.expm1(-lambd * np.maximum(x, 0)), 0.0)
+
+    @staticmethod
+    def binomial_pmf_many(ks, n, p):
+        k = BackendNumPy._arr(ks)
+        if p <= 0 or p >= 1:
+            return np.array([EstadisticaPura.binomial_pmf(v, n, p) for v in k])
+        dentro = (k >= 0) & (k <= n)
+        kd = np.where(dentro, k, 0.0)
+        log_pmf = (math.lgamma(n + 1) - BackendNumPy._lgamma(kd + 1) - BackendNumPy._lgamma(n - kd + 1)
+                   + kd * math.log(p) + (n - kd) * math.log1p(-p))
+        return np.where(dentro, np.exp(log_pmf), 0.0)
+
+    @staticmethod
+    def poisson_pmf_many(ks, lambd):
+        k = BackendNumPy._arr(ks)
+        if lambd <= 0:
+            return np.where(k == 0, 1.0, 0.0)
+        dentro = k >= 0
+        kd = np.where(dentro, k, 0.0)
+        log_pmf = kd * math.log(lambd) - lambd - BackendNumPy._lgamma(kd + 1)
+        return np.where(dentro, np.exp(log_pmf), 0.0)
+
+    @staticmethod
+    def generador(semilla=None):
+        return np.random.default_rng(semilla)
+
+    @staticmethod
+    def muestreador(dist_id, params, rng=None):
+        """Función m -> ndarray con m valores del Generator de NumPy"""
+        gen = rng if rng is not None else np.random.default_rng()
+        if dist_id == "normal":
+            mu, sigma = params[0], params[1]
+            return lambda m: gen.normal(mu, sigma, m)
+        if dist_id == "exponencial":
+            escala = 1 / params[0]
+            return lambda m: gen.exponential(escala, m)
+        if dist_id == "uniforme":
+            a, b = params[0], params[1]
+            return lambda m: gen.uniform(a, b, m)
+        if dist_id == "poisson":
+            lambd = params[0]
+            return lambda m: gen.poisson(lambd, m).astype(float)
+        if dist_id == "binomial":
+            n, p = int(params[0]), params[1]
+            return lambda m: gen.binomial(n, p, m).astype(float)
+        if dist_id == "chi_cuadrado":
+            df = params[0]
+            return lambda m: gen.chisquare(df, m)
+        if dist_id == "t_student":
+            df = params[0]
+            return lambda m: gen.standard_t(df, m)
+        if dist_id == "fisher_f":
+            df1, df2 = params[0], params[1]
+            return lambda m: gen.f(df1, df2, m)
+        return np.zeros
+
+    @staticmethod
+    def muestrear(dist_id, params, n, rng=None):
+        """n valores aleatorios con el Generator de NumPy"""
+        return BackendNumPy.muestreador(dist_id, params, rng)(n)
+
+
+EstadisticaPura.backend = BackendNumPy if np is not None else BackendPuro
+
+
+# ==========================================
+# 3. CACHÉ LRU
+# ==========================================
+class CacheLRU:
+    """Caché acotada con expulsión LRU y contadores de aciertos/fallos
+
+    Las claves se normalizan: los números se redondean a 12 cifras
+    significativas (0.95 y 0.9500000000001 son la misma consulta) y las
+    listas de parámetros se convierten en tuplas.
+    """
+
+    def __init__(self, capacidad=256):
+        self.capacidad = capacidad
+        self.aciertos = 0
+        self.fallos = 0
+        self._datos = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalizar(valor):
+        if isinstance(valor, bool):
+            return valor
+        if isinstance(valor, (int, float)):
+            valor = float(f"{float(valor):.12g}")
+            return 0.0 if valor == 0 else valor  # -0.0 y 0.0 son la misma clave
+        if isinstance(valor, (list, tuple)):
+            return tuple(CacheLRU.normalizar(v) for v in valor)
+        return valor
+
+    def clave(self, *partes):
+        return CacheLRU.normalizar(partes)
+
+    def obtener_o_calcular(self, clave, calcular):
+        """Devuelve el valor guardado o lo calcula; los errores (str) no se guardan"""
+        with self._lock:
+            if clave in self._datos:
+                self._datos.move_to_end(clave)
+                self.aciertos += 1
+                return self._datos[clave]
+            self.fallos += 1
+        valor = calcular()
+        if not isinstance(valor, str):
+            self.guardar(clave, valor)
+        return valor
+
+    def guardar(self, clave, valor):
+        with self._lock:
+            self._datos[clave] = valor
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.capacidad:
+                self._datos.popitem(last=False)
+
+    def redimensionar(self, capacidad):
+        with self._lock:
+            self.capacidad = capacidad
+            while len(self._datos) > capacidad:
+                self._datos.popitem(last=False)
+
+    def limpiar(self):
+        with self._lock:
+            self._datos.clear()
+            self.aciertos = 0
+            self.fallos = 0
+
+    def estadisticas(self):
+        return {"aciertos": self.aciertos, "fallos": self.fallos,
+                "entradas": len(self._datos), "capacidad": self.capacidad}
+
+
+# ==========================================
+# 4. TABLAS PRECALCULADAS (BINARIO + MMAP)
+# ==========================================
+class TablaCritica:
+    """Vista de solo lectura sobre una tabla del archivo binario"""
+
+    def __init__(self, nombre, filas, columnas, valores):
+        self.nombre = nombre
+        self.filas = filas          # etiquetas de fila (z base, gl, ...)
+        self.columnas = columnas    # etiquetas de columna (centésimas, α, ...)
+        self.valores = valores      # fila por fila, len(filas) × len(columnas)
+
+    def valor(self, i, j):
+        return self.valores[i * len(self.columnas) + j]
+
+    def fila(self, i):
+        n = len(self.columnas)
+        return self.valores[i * n:(i + 1) * n]
+
+    def indice_fila(self, etiqueta):
+        """Índice de la fila con esa etiqueta, o None si no está tabulada"""
+        i = bisect.bisect_left(self.filas, etiqueta)
+        if i < len(self.filas) and abs(self.filas[i] - etiqueta) < 1e-9:
+            return i
+        return None
+
+    def interpolar(self, etiqueta, j, transformar=None):
+        """Valor de la columna j para una fila no tabulada
+
+        Interpola linealmente entre las dos filas vecinas en la escala
+        `transformar` (por ejemplo 1/gl para la t, que es casi lineal ahí).
+        Fuera del rango devuelve la fila extrema.
+        """
+        filas = self.filas
+        i = bisect.bisect_left(filas, etiqueta)
+        if i == 0:
+            return self.valor(0, j)
+        if i >= len(filas):
+            return self.valor(len(filas) - 1, j)
+        f = transformar or (lambda v: v)
+        x0, x1, x = f(filas[i - 1]), f(filas[i]), f(etiqueta)
+        y0, y1 = self.valor(i - 1, j), self.valor(i, j)
+        return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+
+
+class TablasCriticas:
+    """Tablas Z, t, χ² y F precalculadas en un binario compacto
+
+    Formato (little-endian): cabecera `MAGIA` + versión (u16) + cantidad de
+    tablas (u16); luego un índice con, por tabla, nombre (8 bytes), filas y
+    columnas (u32) y los offsets (u64) de las etiquetas de fila, de columna y
+    de los valores. Todo lo demás son doubles contiguos, así que una tabla
+    se lee con memoryview.cast('d') directamente sobre el mmap.
+    """
+    MAGIA = b"TBLE"
+    VERSION = 1
+    _CABECERA = struct.Struct("<4sHH")
+    _ENTRADA = struct.Struct("<8sIIQQQ")
+    RUTA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "tablas.bin")
+
+    _cargadas = None
+
+    def __init__(self, buffer, mapa=None):
+        self._mapa = mapa  # se conserva para que el mmap siga abierto
+        vista = memoryview(buffer)
+        magia, version, cantidad = TablasCriticas._CABECERA.unpack_from(vista, 0)
+        if magia != TablasCriticas.MAGIA or version != TablasCriticas.VERSION:
+            raise ValueError("Archivo de tablas no reconocido")
+        self.tablas = {}
+        pos = TablasCriticas._CABECERA.size
+        for _ in range(cantidad):
+            nombre, nf, nc, off_f, off_c, off_v = TablasCriticas._ENTRADA.unpack_from(vista, pos)
+            pos += TablasCriticas._ENTRADA.size
+            nombre = nombre.rstrip(b"\0").decode("ascii")
+            self.tablas[nombre] = TablaCritica(
+                nombre,
+                TablasCriticas._doubles(vista, off_f, nf),
+                TablasCriticas._doubles(vista, off_c, nc),
+                TablasCriticas._doubles(vista, off_v, nf * nc),
+            )
+
+    @staticmethod
+    def _doubles(vista, offset, cantidad):
+        datos = vista[offset:offset + 8 * cantidad]
+        if sys.byteorder == "little":
+            return datos.cast("d")  # sin copia
+        copia = array('d', datos.tobytes())
+        copia.byteswap()
+        return copia
+
+    def __getitem__(self, nombre):
+        return self.tablas[nombre]
+
+    @staticmethod
+    def construir():
+        """Calcula todas las tablas: {nombre: (filas, columnas, valores)}
+
+        Siempre con el backend puro, sin importar el activo: así el binario
+        es el mismo byte a byte con o sin NumPy.
+        """
+        E = EstadisticaPura
+        B = BackendPuro
+        tablas = {}
+
+        # Z de -3.9 a 3.9 como en las tablas impresas: en las filas negativas
+        # la columna .0d se resta (fila -1.9, columna .06 -> z = -1.96), por eso
+        # existen las filas -0.0 y 0.0
+        z_filas = [-i / 10 for i in range(39, -1, -1)] + [i / 10 for i in range(40)]
+        z_filas[39] = -0.0
+        z_cols = [d / 100 for d in range(10)]
+        tablas["z"] = (z_filas, z_cols, B.normal_cdf_many([math.copysign(abs(z) + d, z)
+                                                           for z in z_filas for d in z_cols]))
+
+        t_filas = list(range(1, 1001))
+        t_cols = [0.10, 0.05, 0.025, 0.01, 0.005]
+        tablas["t"] = (t_filas, t_cols, B.t_ppf_many([1 - a / 2 for _ in t_filas for a in t_cols],
+                                                     [df for df in t_filas for _ in t_cols]))
+
+        chi_filas = list(range(1, 101))
+        chi_cols = [0.995, 0.99, 0.975, 0.95, 0.90, 0.10, 0.05, 0.025, 0.01, 0.005]
+        tablas["chi2"] = (chi_filas, chi_cols, [v for df in chi_filas for v in B.chi2_ppf_many(chi_cols, df)])
+
+        # F crítica con α = 0.05: filas gl del denominador, columnas gl del numerador
+        f_filas = list(range(1, 31)) + [40, 60, 120]
+        f_cols = list(range(1, 11)) + [12, 15, 20, 24, 30, 40, 60, 120]
+        tablas["f05"] = (f_filas, f_cols, [E.f_ppf(0.95, d1, d2) for d2 in f_filas for d1 in f_cols])
+        return tablas
+
+    @staticmethod
+    def serializar(tablas):
+        """Empaqueta {nombre: (filas, columnas, valores)} en el formato binario"""
+        partes = []
+        offset = TablasCriticas._CABECERA.size + TablasCriticas._ENTRADA.size * len(tablas)
+        indice = []
+        for nombre, (filas, columnas, valores) in tablas.items():
+            offsets = []
+            for datos in (filas, columnas, valores):
+                buf = array('d', datos)
+                if sys.byteorder != "little":
+                    buf.byteswap()
+                offsets.append(offset)
+                partes.append(buf.tobytes())
+                offset += len(partes[-1])
+            indice.append(TablasCriticas._ENTRADA.pack(
+                nombre.encode("ascii"), len(filas), len(columnas), *offsets))
+        cabecera = TablasCriticas._CABECERA.pack(TablasCriticas.MAGIA, TablasCriticas.VERSION, len(tablas))
+        return cabecera + b"".join(indice) + b"".join(partes)
+
+    @staticmethod
+    def cargar(ruta=None):
+        """Abre el binario con mmap (una sola vez); si falta, lo calcula en memoria"""
+        if TablasCriticas._cargadas is None:
+            ruta = ruta or TablasCriticas.RUTA
+            try:
+                with open(ruta, "rb") as f:
+                    mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                TablasCriticas._cargadas = TablasCriticas(mapa, mapa)
+            except (OSError, ValueError):
+                datos = TablasCriticas.serializar(TablasCriticas.construir())
+                TablasCriticas._cargadas = TablasCriticas(datos)
+        return TablasCriticas._cargadas
+
+
+# ==========================================
+# 5. GESTOR DE GRÁFICOS
+# ==========================================
+class GestorGraficos:
+    """Un chart por distribución; al cambiar parámetros solo se cambian los datos
+
+    El primer gráfico de cada distribución se construye completo (ejes,
+    bordes, colores). Después solo se reemplazan `points` (o
+    `groups`) y los rangos de los ejes. Los datos de los últimos
+    parámetros usados quedan en una CacheLRU, así que volver a una
+    combinación reciente no recalcula nada.
+    """
+
+    def __init__(self, capacidad=16):
+        self.graficos = {}
+        self.datos = CacheLRU(capacidad)
+
+    @staticmethod
+    def rangos(chart, elementos):
+        """Rangos de ejes que corresponden a los elementos del chart"""
+        margen = 1.05
+        if isinstance(chart, fch.BarChart):
+            return {"max_y": max((r.to_y for g in elementos for r in g.rods), default=1.0) * margen}
+        return {
+            "min_x": elementos[0].x,
+            "max_x": elementos[-1].x,
+            "max_y": max((p.y for p in elementos), default=1.0) * margen,
+        }
+
+    @staticmethod
+    def aplicar(chart, elementos, rangos):
+        if isinstance(chart, fch.BarChart):
+            chart.groups = elementos
+        else:
+            chart.data_series[0].points = elementos
+        for nombre, valor in rangos.items():
+            setattr(chart, nombre, valor)
+
+    def obtener(self, dist_id, params, max_barras):
+        """Chart de la distribución con los datos de `params`
+
+        `max_barras` sale del ancho del chart y forma parte de la clave: el
+        mismo parámetro con otro ancho agrupa las barras de otra manera.
+        """
+        clave = self.datos.clave(dist_id, params, max_barras)
+        chart = self.graficos.get(dist_id)
+        if chart is None:
+            chart = EstadisticaPura.generar_grafico_dispatch(dist_id, params, max_barras)
+            if isinstance(chart, (fch.LineChart, fch.BarChart)):
+                elementos = chart.groups if isinstance(chart, fch.BarChart) else chart.data_series[0].points
+                datos = (elementos, self.rangos(chart, elementos))
+                self.datos.guardar(clave, datos)
+                self.aplicar(chart, *datos)
+                self.graficos[dist_id] = chart
+            return chart
+
+        def calcular():
+            elementos = EstadisticaPura.generar_datos_dispatch(dist_id, params, max_barras)
+            return elementos, self.rangos(chart, elementos)
+
+        self.aplicar(chart, *self.datos.obtener_o_calcular(clave, calcular))
+        return chart
+
+    def limpiar(self):
+        self.graficos.clear()
+        self.datos.limpiar()
+
+
+# ==========================================
+# 6. SIMULACIÓN MONTE CARLO POR BLOQUES
+# ==========================================
+class MotorSimulacion:
+    """Genera muestras de una distribución en bloques de tamaño fijo
+
+    El generador de cada distribución se resuelve una vez al crear el
+    motor; después `bloques(n)` entrega array('d') de a lo sumo
+    `tam_bloque` valores, de modo que n = 10^7 o más se recorre con
+    memoria acotada. `muestras(n)` junta todo en un solo array('d') para
+    cuando sí se necesitan los datos crudos.
+
+    n se parte en tramos de TAM_TRAMO valores; cada tramo usa su propio
+    generador, sembrado con SHA-256 de "semilla:índice". En serie los
+    tramos se recorren en este proceso; con `procesos` > 1 y
+    n >= UMBRAL_PARALELO se simulan en un ProcessPoolExecutor. Así el
+    resultado depende solo de la semilla (no de cuántos procesos haya ni
+    de qué proceso tomó cada tramo). Si el pool no se puede crear o se
+    rompe, los tramos que faltan se simulan en este proceso con las mismas
+    semillas.
+    """
+    TAM_BLOQUE = 1 << 16
+    TAM_TRAMO = 1 << 18
+    UMBRAL_PARALELO = 1 << 20
+
+    def __init__(self, dist_id, params, semilla=None, tam_bloque=None, backend=None, procesos=1):
+        self.backend = backend if backend is not None else EstadisticaPura.backend
+        self.dist_id = dist_id
+        self.params = params
+        self.semilla = semilla
+        self.procesos = procesos
+        self.tam_bloque = tam_bloque or MotorSimulacion.TAM_BLOQUE
+        self.rng = self.backend.generador(semilla)
+        self._bloque = self.backend.muestreador(dist_id, params, self.rng)
+
+    @staticmethod
+    def semilla_tramo(semilla, indice):
+        """Semilla de 64 bits derivada de (semilla, índice) con SHA-256"""
+        digest = hashlib.sha256(f"{semilla}:{indice}".encode()).digest()
+        return int.from_bytes(digest[:8], "little")
+
+    @staticmethod
+    def simular_tramo(nombre_backend, dist_id, params, semilla, m, tam_bloque):
+        """Trabajo de un proceso: m valores como bytes de un array('d')"""
+        backend = BackendNumPy if nombre_backend == "numpy" else BackendPuro
+        res = array('d')
+        for bloque in MotorSimulacion(dist_id, params, semilla, tam_bloque, backend).bloques_directos(m):
+            res.extend(bloque)
+        return res.tobytes()
+
+    def tramos(self, n):
+        """Argumentos de simular_tramo para cada tramo de n"""
+        base = self.semilla if self.semilla is not None else random.SystemRandom().getrandbits(64)
+        paso = MotorSimulacion.TAM_TRAMO
+        return [
+            (self.backend.nombre, self.dist_id, self.params,
+             MotorSimulacion.semilla_tramo(base, i), min(paso, n - inicio), self.tam_bloque)
+            for i, inicio in enumerate(range(0, n, paso))
+        ]
+
+    def bloques_paralelo(self, n):
+        """Como bloques(n), repartiendo los tramos entre procesos
+
+        Los resultados se entregan en orden y con a lo sumo procesos + 2
+        tramos en vuelo, para que la memoria siga acotada.
+        """
+        tramos = self.tramos(n)
+        siguiente = 0
+        try:
+            with ProcessPoolExecutor(self.procesos) as pool:
+                en_vuelo = deque()
+                enviados = 0
+                while siguiente < len(tramos):
+                    while enviados < len(tramos) and len(en_vuelo) < self.procesos + 2:
+                        en_vuelo.append(pool.submit(MotorSimulacion.simular_tramo, *tramos[enviados]))
+                        enviados += 1
+                    datos = array('d', en_vuelo.popleft().result())
+                    siguiente += 1
+                    yield datos
+        except (BrokenProcessPool, OSError, NotImplementedError):
+            pass
+        for tramo in tramos[siguiente:]:
+            yield array('d', MotorSimulacion.simular_tramo(*tramo))
+
+    def bloques(self, n):
+        """Itera bloques array('d') hasta completar n valores"""
+        if self.procesos > 1 and n >= MotorSimulacion.UMBRAL_PARALELO:
+            yield from self.bloques_paralelo(n)
+            return
+        # En serie: los mismos tramos y semillas que en paralelo, en este proceso
+        for _, dist_id, params, semilla, m, tam_bloque in self.tramos(n):
+            yield from MotorSimulacion(dist_id, params, semilla, tam_bloque, self.backend).bloques_directos(m)
+
+    def bloques_directos(self, n):
+        """n valores seguidos del generador propio del motor (un tramo)"""
+        restantes = n
+        while restantes > 0:
+            m = min(restantes, self.tam_bloque)
+            bloque = self._bloque(m)
+            if not isinstance(bloque, array):
+                bloque = array('d', np.ascontiguousarray(bloque, dtype=float).tobytes())
+            restantes -= m
+            yield bloque
+
+    def muestras(self, n):
+        res = array('d')
+        for bloque in self.bloques(n):
+            res.extend(bloque)
+        return res
+
+
+# ==========================================
+# 7. RESÚMENES EN LÍNEA DE SIMULACIÓN
+# ==========================================
+class HistogramaFijo:
+    """Histograma de bordes fijos: memoria O(bins) para cualquier n
+
+    Los valores fuera de [inicio, fin] se cuentan aparte (debajo/encima).
+    Como los bordes no cambian, los datos pueden llegar por bloques.
+    """
+    REGLAS = {
+        "sturges": "Sturges",
+        "scott": "Scott",
+        "freedman_diaconis": "Freedman–Diaconis",
+    }
+    MAX_CLASES = 200
+
+    def __init__(self, inicio, fin, bins=30):
+        if not fin > inicio:
+            fin = inicio + 1.0
+        self.inicio = inicio
+        self.fin = fin
+        self.bins = bins
+        self.ancho = (fin - inicio) / bins
+        self.conteos = [0] * bins
+        self.debajo = 0
+        self.encima = 0
+
+    @staticmethod
+    def desde_valores(ordenados, bins=30, margen=0.05, recorte=0.0):
+        """Bordes a partir de un bloque piloto ordenado, con un margen a cada lado
+
+        Con `recorte` > 0 y colas pesadas (el rango completo del piloto es
+        más del doble que el de sus cuantiles recorte y 1 - recorte, como en
+        una t con pocos gl) los bordes salen de esos cuantiles: un extremo
+        aislado no aplasta todo el histograma en una barra. Lo que quede
+        afuera va a debajo/encima.
+        """
+        lo, hi = ordenados[0], ordenados[-1]
+        i = int(recorte * (len(ordenados) - 1))
+        if i and hi - lo > 2 * (ordenados[-1 - i] - ordenados[i]):
+            lo, hi = ordenados[i], ordenados[-1 - i]
+        extra = (hi - lo) * margen or 0.5
+        return HistogramaFijo(lo - extra, hi + extra, bins)
+
+    @staticmethod
+    def numero_clases(regla, n, rango, desv=0.0, iqr=0.0):
+        """Cantidad de clases según la regla
+
+        Sturges: k = ⌈log2 n⌉ + 1. Scott: h = 3.49·s·n^(-1/3).
+        Freedman–Diaconis: h = 2·IQR·n^(-1/3). Si el ancho h sale 0
+        (datos repetidos) se usa Sturges.
+        """
+        if regla not in HistogramaFijo.REGLAS:
+            raise ValueError(f"Regla de clases desconocida: {regla}")
+        if n < 2 or rango <= 0:
+            return 1
+        sturges = math.ceil(math.log2(n)) + 1
+        if regla == "scott":
+            ancho = 3.49 * desv * n ** (-1 / 3)
+        elif regla == "freedman_diaconis":
+            ancho = 2 * iqr * n ** (-1 / 3)
+        else:
+            ancho = 0.0
+        k = math.ceil(rango / ancho) if ancho > 0 else sturges
+        return max(1, min(k, HistogramaFijo.MAX_CLASES))
+
+    @staticmethod
+    def con_regla(regla, n, minimo, maximo, desv=0.0, iqr=0.0, margen=0.0):
+        """Histograma vacío con las clases de la regla sobre [minimo, maximo]
+
+        Con margen > 0 el rango se amplía a cada lado conservando el ancho de
+        clase, para los datos que sigan llegando con los bordes ya fijos.
+        """
+        rango = maximo - minimo
+        k = HistogramaFijo.numero_clases(regla, n, rango, desv, iqr)
+        if not margen or rango <= 0:
+            return HistogramaFijo(minimo, maximo, k)
+        ancho = rango / k
+        extra = math.ceil(k * margen)
+        return HistogramaFijo(minimo - extra * ancho, maximo + extra * ancho, k + 2 * extra)
+
+    def bordes(self):
+        return [self.inicio + i * self.ancho for i in range(self.bins)] + [self.fin]
+
+    @property
+    def total(self):
+        return sum(self.conteos) + self.debajo + self.encima
+
+    def agregar_ordenado(self, ordenados):
+        """Cuenta un bloque ya ordenado con bisect: O(bins · log m) en vez de O(m)"""
+        bordes = self.bordes()
+        anterior = bisect.bisect_left(ordenados, bordes[0])
+        self.debajo += anterior
+        for i in range(self.bins):
+            # El último bin es cerrado a la derecha
+            corte = (bisect.bisect_right if i == self.bins - 1 else bisect.bisect_left)(ordenados, bordes[i + 1])
+            self.conteos[i] += corte - anterior
+            anterior = corte
+        self.encima += len(ordenados) - anterior
+
+    def agregar(self, valores):
+        self.agregar_ordenado(sorted(valores))
+
+    def tabla_frecuencias(self):
+        """Filas de la tabla de frecuencias: clase, marca, f, fr, F y Fr
+
+        Las frecuencias relativas son sobre el total, incluidos los valores
+        fuera de los bordes (debajo/encima).
+        """
+        total = self.total or 1
+        bordes = self.bordes()
+        filas = []
+        acumulada = self.debajo
+        for i, f in enumerate(self.conteos):
+            acumulada += f
+            filas.append({
+                "desde": bordes[i],
+                "hasta": bordes[i + 1],
+                "marca": (bordes[i] + bordes[i + 1]) / 2,
+                "f": f,
+                "fr": f / total,
+                "F": acumulada,
+                "Fr": acumulada / total,
+            })
+        return filas
+
+
+class TDigest:
+    """Cuantiles aproximados y fusionables con memoria acotada (t-digest)
+
+    Los valores se agrupan en centroides (media, peso) cuyo tamaño máximo
+    fija la función de escala k1(q) = δ/(2π)·asin(2q − 1): en las colas los
+    centroides son chicos y en el centro más grandes, de modo que quedan a
+    lo sumo ~δ (`compresion`). El error de rango es del orden de 1/δ en la
+    mediana y mucho menor en las colas; `con_precision` elige δ a partir
+    del error buscado.
+
+    Mientras no se superen `umbral_exacto` valores se guardan tal cual y
+    los cuantiles son exactos. Dos digests se combinan con `fusionar`.
+    """
+
+    def __init__(self, compresion=200, umbral_exacto=0):
+        self.compresion = compresion
+        self.umbral_exacto = umbral_exacto
+        self.medias = []
+        self.pesos = []
+        self.n = 0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+        self._buffer = array('d')
+
+    @staticmethod
+    def con_precision(error_rango, umbral_exacto=0):
+        """Digest con error de rango aproximado `error_rango` cerca de la mediana"""
+        return TDigest(max(20, math.ceil(1 / error_rango)), umbral_exacto)
+
+    @property
+    def exacto(self):
+        return not self.medias
+
+    def _q_limite(self, q):
+        """Cuantil donde termina el centroide que empieza en q (k1 + 1)"""
+        delta = self.compresion
+        k = delta / (2 * math.pi) * math.asin(max(-1.0, min(1.0, 2 * q - 1))) + 1
+        if k >= delta / 4:
+            return 1.0
+        return (math.sin(2 * math.pi * k / delta) + 1) / 2
+
+    def agregar_muchos(self, valores):
+        m = len(valores)
+        if not m:
+            return
+        self._buffer.extend(valores)
+        self.n += m
+        self.minimo = min(self.minimo, min(valores))
+        self.maximo = max(self.maximo, max(valores))
+        if self.medias or self.n > self.umbral_exacto:
+            if not self.medias or len(self._buffer) > 50 * self.compresion:
+                self._comprimir()
+
+    def agregar(self, x):
+        self.agregar_muchos((x,))
+
+    def _comprimir(self):
+        """Pasa el buffer a centroides y los fusiona con los existentes"""
+        if not self._buffer:
+            return
+        valores = sorted(self._buffer)
+        self._buffer = array('d')
+        m = len(valores)
+        # Centroides del bloque según sus propios cuantiles: cada uno es un
+        # tramo contiguo del bloque ordenado, promediado con fsum
+        medias, pesos = [], []
+        inicio = 0
+        while inicio < m:
+            fin = max(inicio + 1, min(m, int(self._q_limite(inicio / m) * m)))
+            medias.append(math.fsum(valores[inicio:fin]) / (fin - inicio))
+            pesos.append(fin - inicio)
+            inicio = fin
+        self._fusionar_centroides(medias, pesos)
+
+    def _fusionar_centroides(self, medias, pesos):
+        pares = sorted(zip(self.medias + medias, self.pesos + pesos))
+        total = sum(p for _, p in pares)
+        nuevas_medias, nuevos_pesos = [], []
+        acumulado = 0.0
+        media, peso = pares[0]
+        limite = self._q_limite(0.0) * total
+        for m, w in pares[1:]:
+            if acumulado + peso + w <= limite:
+                peso += w
+                media += (m - media) * w / peso
+            else:
+                nuevas_medias.append(media)
+                nuevos_pesos.append(peso)
+                acumulado += peso
+                limite = self._q_limite(acumulado / total) * total
+                media, peso = m, w
+        nuevas_medias.append(media)
+        nuevos_pesos.append(peso)
+        self.medias, self.pesos = nuevas_medias, nuevos_pesos
+
+    def fusionar(self, otro):
+        """Incorpora otro digest (p. ej. el de otro proceso o bloque)"""
+        if otro.exacto:
+            self.agregar_muchos(otro._buffer)
+            return self
+        self._comprimir()
+        self.n += otro.n
+        self.minimo = min(self.minimo, otro.minimo)
+        self.maximo = max(self.maximo, otro.maximo)
+        otro._comprimir()
+        self._fusionar_centroides(list(otro.medias), list(otro.pesos))
+        return self
+
+    def cuantil(self, q):
+        """Cuantil q; exacto (interpolación lineal tipo 7) mientras no se comprimió"""
+        if not self.n:
+            return float('nan')
+        q = min(max(q, 0.0), 1.0)
+        if self.exacto:
+            self._buffer = array('d', sorted(self._buffer))
+            h = (self.n - 1) * q
+            i = math.floor(h)
+            if i + 1 >= self.n:
+                return self._buffer[-1]
+            return self._buffer[i] + (h - i) * (self._buffer[i + 1] - self._buffer[i])
+
+        self._comprimir()
+        medias, pesos = self.medias, self.pesos
+        objetivo = q * self.n
+        if objetivo <= pesos[0] / 2:
+            if pesos[0] == 1:
+                return medias[0]
+            return self.minimo + (medias[0] - self.minimo) * objetivo / (pesos[0] / 2)
+        if objetivo >= self.n - pesos[-1] / 2:
+            if pesos[-1] == 1:
+                return medias[-1]
+            return self.maximo - (self.maximo - medias[-1]) * (self.n - objetivo) / (pesos[-1] / 2)
+        acumulado = pesos[0] / 2
+        for i in range(len(medias) - 1):
+            paso = (pesos[i] + pesos[i + 1]) / 2
+            if objetivo <= acumulado + paso:
+                return medias[i] + (medias[i + 1] - medias[i]) * (objetivo - acumulado) / paso
+            acumulado += paso
+        return medias[-1]
+
+
+class ResumenSimulacion:
+    """Resumen en línea de una simulación por bloques
+
+    Cada bloque se ordena una vez y de ahí salen los extremos, el
+    histograma (bisect sobre bordes fijos) y el t-digest de cuantiles
+    (exacto hasta UMBRAL_EXACTO valores). La media y la varianza se
+    combinan bloque a bloque con la fórmula de Welford/Chan. La memoria es
+    O(bins + compresión); las muestras crudas solo se guardan con
+    guardar_muestras=True. `precision_cuantiles` es el error de rango
+    buscado del t-digest (ver TDigest.con_precision).
+    """
+    PRIMEROS = 20
+    UMBRAL_EXACTO = 100_000
+    PRECISION_CUANTILES = 0.005
+    # Cuantiles del primer bloque que fijan los bordes del histograma
+    RECORTE_PILOTO = 0.001
+
+    def __init__(self, bins=30, guardar_muestras=False, precision_cuantiles=None):
+        self.bins = bins
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+        self.histograma = None
+        self.cuantiles = TDigest.con_precision(precision_cuantiles or ResumenSimulacion.PRECISION_CUANTILES,
+                                               umbral_exacto=ResumenSimulacion.UMBRAL_EXACTO)
+        self.primeros = array('d')
+        self.muestras = array('d') if guardar_muestras else None
+
+    def agregar(self, bloque):
+        m = len(bloque)
+        if not m:
+            return
+        ordenados = sorted(bloque)
+        media_b = math.fsum(bloque) / m
+        m2_b = math.fsum((x - media_b) ** 2 for x in bloque)
+        total = self.n + m
+        delta = media_b - self.media
+        self.media += delta * m / total
+        self.m2 += m2_b + delta * delta * self.n * m / total
+        self.n = total
+        self.minimo = min(self.minimo, ordenados[0])
+        self.maximo = max(self.maximo, ordenados[-1])
+        if self.histograma is None:
+            self.histograma = HistogramaFijo.desde_valores(ordenados, self.bins, recorte=ResumenSimulacion.RECORTE_PILOTO)
+        self.histograma.agregar_ordenado(ordenados)
+        self.cuantiles.agregar_muchos(ordenados)
+        if len(self.primeros) < ResumenSimulacion.PRIMEROS:
+            self.primeros.extend(bloque[:ResumenSimulacion.PRIMEROS - len(self.primeros)])
+        if self.muestras is not None:
+            self.muestras.extend(bloque)
+
+    def consumir(self, bloques):
+        for bloque in bloques:
+            self.agregar(bloque)
+        return self
+
+    @property
+    def varianza(self):
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def desviacion(self):
+        return math.sqrt(self.varianza)
+
+    def cuantil(self, q):
+        return self.cuantiles.cuantil(q)
+
+
+# ==========================================
+# 8. ESTADÍSTICA DESCRIPTIVA
+# ==========================================
+class AcumuladorDescriptivo:
+    """n, suma, media, M2, M3, M4, mínimo y máximo en una sola pasada
+
+    Los momentos centrales (M2, M3, M4: sumas de desvíos al cuadrado, cubo
+    y cuarta potencia) se actualizan con las fórmulas de combinación de
+    Pébay, que generalizan Welford/Chan; agregar un valor es combinar con
+    un conjunto de peso 1 y quitarlo, con uno de peso -1. La suma lleva
+    compensación de Neumaier.
+    """
+    __slots__ = ("n", "suma", "_compensacion", "media", "m2", "m3", "m4", "minimo", "maximo")
+
+    def __init__(self, valores=()):
+        self.n = 0
+        self.suma = 0.0
+        self._compensacion = 0.0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+        self.agregar_muchos(valores)
+
+    def _sumar(self, x):
+        t = self.suma + x
+        if abs(self.suma) >= abs(x):
+            self._compensacion += (self.suma - t) + x
+        else:
+            self._compensacion += (x - t) + self.suma
+        self.suma = t
+
+    def _combinar(self, nb, media_b, m2b=0.0, m3b=0.0, m4b=0.0):
+        """Combina los momentos con los de otro conjunto (nb puede ser negativo)"""
+        na = self.n
+        n = na + nb
+        if n == 0:
+            self.n, self.media, self.m2, self.m3, self.m4 = 0, 0.0, 0.0, 0.0, 0.0
+            return
+        delta = media_b - self.media
+        d_n = delta / n
+        m2a, m3a = self.m2, self.m3
+        self.m4 += (m4b + delta * d_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+                    + 6 * d_n * d_n * (na * na * m2b + nb * nb * m2a) + 4 * d_n * (na * m3b - nb * m3a))
+        self.m3 += m3b + delta * d_n * d_n * na * nb * (na - nb) + 3 * d_n * (na * m2b - nb * m2a)
+        self.m2 += m2b + delta * d_n * na * nb
+        self.media += d_n * nb
+        self.n = n
+
+    def agregar(self, x):
+        self._sumar(x)
+        self._combinar(1, x)
+        if x < self.minimo:
+            self.minimo = x
+        if x > self.maximo:
+            self.maximo = x
+
+    def agregar_muchos(self, valores):
+        # Bloques grandes: sus momentos se calculan aparte y se fusionan
+        if len(valores) >= 64:
+            return self.fusionar(AcumuladorDescriptivo.de_bloque(valores))
+        agregar = self.agregar
+        for x in valores:
+            agregar(x)
+        return self
+
+    @staticmethod
+    def de_bloque(valores):
+        """Acumulador de un bloque en memoria
+
+        La suma (fsum), el mínimo y el máximo salen en C; M2, M3 y M4 en una
+        sola pasada sobre los desvíos, sin listas intermedias.
+        """
+        acumulador = AcumuladorDescriptivo()
+        n = len(valores)
+        if n:
+            suma = math.fsum(valores)
+            media = suma / n
+            m2 = m3 = m4 = 0.0
+            for x in valores:
+                d = x - media
+                d2 = d * d
+                m2 += d2
+                m3 += d2 * d
+                m4 += d2 * d2
+            acumulador.n = n
+            acumulador.suma = suma
+            acumulador.media = media
+            acumulador.m2 = m2
+            acumulador.m3 = m3
+            acumulador.m4 = m4
+            acumulador.minimo = min(valores)
+            acumulador.maximo = max(valores)
+        return acumulador
+
+    def quitar(self, x):
+        """Deshace agregar(x) en n, suma y momentos
+
+        El mínimo y el máximo no se pueden deshacer: quien quite valores
+        debe tomarlos de otra estructura (p. ej. una lista ordenada).
+        """
+        if self.n <= 1:
+            self.__init__()
+            return
+        self._sumar(-x)
+        self._combinar(-1, x)
+        self.m2 = max(0.0, self.m2)
+        self.m4 = max(0.0, self.m4)
+
+    def fusionar(self, otro):
+        if not otro.n:
+            return self
+        self._combinar(otro.n, otro.media, otro.m2, otro.m3, otro.m4)
+        self._sumar(otro.suma)
+        self._compensacion += otro._compensacion
+        self.minimo = min(self.minimo, otro.minimo)
+        self.maximo = max(self.maximo, otro.maximo)
+        return self
+
+    @property
+    def total(self):
+        """Suma compensada"""
+        return self.suma + self._compensacion
+
+    @property
+    def rango(self):
+        return self.maximo - self.minimo
+
+    @property
+    def varianza(self):
+        """Varianza poblacional (divide entre n)"""
+        return self.m2 / self.n if self.n else 0.0
+
+    @property
+    def varianza_muestral(self):
+        """Varianza muestral (divide entre n - 1)"""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def error_estandar(self):
+        """Error estándar de la media, s/√n"""
+        return math.sqrt(self.varianza_muestral / self.n) if self.n > 1 else None
+
+    @property
+    def coef_variacion(self):
+        """s / |media|; None si la media es 0"""
+        return math.sqrt(self.varianza_muestral) / abs(self.media) if self.n > 1 and self.media else None
+
+    @property
+    def asimetria(self):
+        """Asimetría muestral ajustada G1 (la de Excel/SPSS); None si n < 3"""
+        n = self.n
+        if n < 3 or self.m2 <= 0:
+            return None
+        g1 = math.sqrt(n) * self.m3 / self.m2 ** 1.5
+        return g1 * math.sqrt(n * (n - 1)) / (n - 2)
+
+    @property
+    def curtosis(self):
+        """Exceso de curtosis muestral G2 (la de Excel/SPSS); None si n < 4"""
+        n = self.n
+        if n < 4 or self.m2 <= 0:
+            return None
+        g2 = n * self.m4 / (self.m2 * self.m2) - 3
+        return ((n + 1) * g2 + 6) * (n - 1) / ((n - 2) * (n - 3))
+
+    @staticmethod
+    def corridas(ordenados):
+        """(valor, veces) de cada corrida de valores iguales de un arreglo ordenado"""
+        i, n = 0, len(ordenados)
+        while i < n:
+            j = bisect.bisect_right(ordenados, ordenados[i], i)
+            yield ordenados[i], j - i
+            i = j
+
+    @staticmethod
+    def mediana_y_modas(ordenados):
+        """Mediana y valores más frecuentes a partir de los datos ya ordenados
+
+        Las frecuencias salen de recorrer las corridas de valores iguales del
+        mismo arreglo ordenado, sin diccionario aparte.
+        """
+        n = len(ordenados)
+        if not n:
+            return None, []
+        if n % 2 == 0:
+            mediana = (ordenados[n // 2 - 1] + ordenados[n // 2]) / 2
+        else:
+            mediana = ordenados[n // 2]
+        modas, max_freq = [], 0
+        for valor, veces in AcumuladorDescriptivo.corridas(ordenados):
+            if veces > max_freq:
+                modas, max_freq = [valor], veces
+            elif veces == max_freq:
+                modas.append(valor)
+        return mediana, modas
+
+
+class ListaOrdenadaBloques:
+    """Lista ordenada partida en bloques de ~`carga` elementos
+
+    Insertar o quitar cuesta O(log n + carga) y el k-ésimo estadístico de
+    orden O(n / carga), sin reordenar todo cada vez que llegan datos.
+    """
+
+    def __init__(self, valores=(), carga=512):
+        self.carga = carga
+        self._bloques = []
+        self._maximos = []
+        self._len = 0
+        self.reconstruir(sorted(valores))
+
+    def reconstruir(self, ordenados):
+        """Reparte un arreglo ya ordenado en bloques"""
+        self._bloques = [list(ordenados[i:i + self.carga]) for i in range(0, len(ordenados), self.carga)]
+        self._maximos = [b[-1] for b in self._bloques]
+        self._len = len(ordenados)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for bloque in self._bloques:
+            yield from bloque
+
+    def bloques(self):
+        """Los bloques en orden; cada uno es una lista ordenada"""
+        return iter(self._bloques)
+
+    def insertar(self, x):
+        if not self._bloques:
+            self._bloques.append([x])
+            self._maximos.append(x)
+            self._len = 1
+            return
+        i = bisect.bisect_left(self._maximos, x)
+        if i == len(self._bloques):
+            i -= 1
+        bloque = self._bloques[i]
+        bisect.insort(bloque, x)
+        self._maximos[i] = bloque[-1]
+        self._len += 1
+        if len(bloque) > 2 * self.carga:
+            mitad = len(bloque) // 2
+            self._bloques[i:i + 1] = [bloque[:mitad], bloque[mitad:]]
+            self._maximos[i:i + 1] = [bloque[mitad - 1], bloque[-1]]
+
+    def quitar(self, x):
+        """Quita una aparición de x; ValueError si no está"""
+        i = bisect.bisect_left(self._maximos, x)
+        if i < len(self._bloques):
+            bloque = self._bloques[i]
+            j = bisect.bisect_left(bloque, x)
+            if j < len(bloque) and bloque[j] == x:
+                del bloque[j]
+                self._len -= 1
+                if bloque:
+                    self._maximos[i] = bloque[-1]
+                else:
+                    del self._bloques[i]
+                    del self._maximos[i]
+                return
+        raise ValueError(f"{x} no está en la lista")
+
+    def __getitem__(self, k):
+        if k < 0:
+            k += self._len
+        if not 0 <= k < self._len:
+            raise IndexError("índice fuera de rango")
+        for bloque in self._bloques:
+            if k < len(bloque):
+                return bloque[k]
+            k -= len(bloque)
+
+
+class SesionDescriptiva:
+    """Estadísticas descriptivas que se actualizan con los datos agregados
+
+    Mantiene un AcumuladorDescriptivo, una ListaOrdenadaBloques y las
+    frecuencias (con los valores agrupados por frecuencia para conocer la
+    moda en O(1)). Agregar Δ valores cuesta O(Δ log n): los momentos se
+    actualizan al momento y los valores esperan en un array('d') hasta que
+    se pide un estadístico de orden o la moda.
+
+    `sincronizar(texto)` recibe el texto completo de la Calculadora y solo
+    interpreta lo que se agregó desde la última llamada; si el texto
+    anterior ya no es prefijo del nuevo, se empieza de cero. En modo
+    aproximado el último número sin separador queda en `pendiente`.
+
+    Pasados UMBRAL_EXACTO valores la sesión pasa a modo aproximado: el
+    orden y las frecuencias se descartan y los cuantiles salen de un
+    TDigest con error de rango `precision_cuantiles`, con memoria acotada
+    para cualquier n (la moda deja de estar disponible). Los histogramas de cada regla quedan con los bordes de ese
+    momento y siguen contando los bloques que llegan.
+    """
+    SEPARADORES = " ,\t\n\r"
+    UMBRAL_EXACTO = 1_000_000
+    PRECISION_CUANTILES = 0.005
+
+    def __init__(self, valores=(), precision_cuantiles=None):
+        self.precision_cuantiles = precision_cuantiles or SesionDescriptiva.PRECISION_CUANTILES
+        self.reiniciar()
+        self.agregar_muchos(valores)
+
+    def reiniciar(self):
+        self.acumulador = AcumuladorDescriptivo()
+        self.orden = ListaOrdenadaBloques()
+        self.frecuencias = {}
+        self.por_frecuencia = {}
+        self.max_freq = 0
+        self.texto = ""
+        self._pendientes = array('d')
+        self.digest = None
+        self.histogramas = {}
+        self.pendiente = ""
+
+    @property
+    def n(self):
+        return self.acumulador.n
+
+    @property
+    def aproximado(self):
+        return self.digest is not None
+
+    def _pasar_a_aproximado(self):
+        """Vuelca todos los valores a un TDigest y libera las estructuras exactas"""
+        self.digest = TDigest.con_precision(self.precision_cuantiles)
+        orden, pendientes = self.orden, self._pendientes
+        self.orden = ListaOrdenadaBloques()
+        self._pendientes = array('d')
+        self.frecuencias, self.por_frecuencia, self.max_freq = {}, {}, 0
+        bloque = array('d')
+        for x in orden:
+            bloque.append(x)
+            if len(bloque) >= MotorSimulacion.TAM_BLOQUE:
+                self.digest.agregar_muchos(bloque)
+                bloque = array('d')
+        self.digest.agregar_muchos(bloque)
+        self.digest.agregar_muchos(pendientes)
+        # quitar() no corrige los extremos del acumulador: se toman de los datos
+        # exactos, y desde aquí ya no se quitan valores
+        pendientes = sorted(pendientes)
+        extremos = [v for lista in (orden, pendientes) if len(lista) for v in (lista[0], lista[-1])]
+        self.acumulador.minimo, self.acumulador.maximo = min(extremos), max(extremos)
+        # Bordes fijos desde aquí: el IQR sale del digest, con margen para lo que venga
+        self.histogramas = {regla: self._histograma_vacio(regla, margen=0.25) for regla in HistogramaFijo.REGLAS}
+        for histograma in self.histogramas.values():
+            for bloque in orden.bloques():
+                histograma.agregar_ordenado(bloque)
+            histograma.agregar_ordenado(pendientes)
+
+    def _contar(self, x, cambio):
+        """Mueve x de su frecuencia actual a frecuencia + cambio (±1)"""
+        veces = self.frecuencias.get(x, 0)
+        nueva = veces + cambio
+        if veces:
+            grupo = self.por_frecuencia[veces]
+            grupo.discard(x)
+            if not grupo:
+                del self.por_frecuencia[veces]
+        if nueva:
+            self.frecuencias[x] = nueva
+            self.por_frecuencia.setdefault(nueva, set()).add(x)
+        else:
+            del self.frecuencias[x]
+        if nueva > self.max_freq:
+            self.max_freq = nueva
+        elif veces == self.max_freq and veces not in self.por_frecuencia:
+            self.max_freq = nueva
+
+    def agregar_muchos(self, valores):
+        if not len(valores):
+            return
+        self.acumulador.agregar_muchos(valores)
+        if self.digest is not None:
+            self.digest.agregar_muchos(valores)
+            ordenados = sorted(valores)
+            for histograma in self.histogramas.values():
+                histograma.agregar_ordenado(ordenados)
+            return
+        self._pendientes.extend(valores)
+        if self.n > SesionDescriptiva.UMBRAL_EXACTO:
+            self._pasar_a_aproximado()
+
+    def _consolidar(self):
+        """Lleva los valores pendientes al orden y a las frecuencias"""
+        valores = self._pendientes
+        if not valores:
+            return
+        self._pendientes = array('d')
+        if len(valores) * 8 > len(self.orden):
+            # Carga grande: un solo sort que sirve para el orden y las frecuencias
+            ordenados = sorted(list(self.orden) + valores.tolist())
+            self.orden.reconstruir(ordenados)
+            self.frecuencias = dict(AcumuladorDescriptivo.corridas(ordenados))
+            self.por_frecuencia = {}
+            for x, veces in self.frecuencias.items():
+                self.por_frecuencia.setdefault(veces, set()).add(x)
+            self.max_freq = max(self.por_frecuencia)
+        else:
+            for x in valores:
+                self.orden.insertar(x)
+                self._contar(x, 1)
+
+    def quitar(self, x):
+        if self.digest is not None:
+            raise ValueError("No se pueden quitar valores en modo aproximado")
+        self._consolidar()
+        self.orden.quitar(x)
+        self.acumulador.quitar(x)
+        self._contar(x, -1)
+
+    @staticmethod
+    def interpretar(texto):
+        return [float(x) for x in texto.replace(",", " ").split()]
+
+    def sincronizar(self, texto):
+        """Incorpora lo agregado al texto desde la última llamada"""
+        anterior = self.texto
+        quitado = None
+        if not texto.startswith(anterior):
+            valores = self.interpretar(texto)
+            self.reiniciar()
+            inicio = 0
+        else:
+            inicio = len(anterior)
+            # Si el último número quedó a medio escribir ("3" -> "34") se vuelve a leer
+            if anterior and anterior[-1] not in self.SEPARADORES and texto[inicio:inicio + 1] not in ("", *self.SEPARADORES):
+                inicio = max(anterior.rfind(c) for c in self.SEPARADORES) + 1
+                quitado = float(anterior[inicio:])
+            valores = self.interpretar(texto[inicio:])
+        # En modo aproximado un número no se puede quitar: el último, si todavía
+        # no lo sigue un separador, queda pendiente hasta que llegue uno
+        self.pendiente = ""
+        if valores and texto[-1] not in self.SEPARADORES and (
+                self.aproximado or self.n + len(valores) > SesionDescriptiva.UMBRAL_EXACTO):
+            corte = max(texto.rfind(c) for c in self.SEPARADORES) + 1
+            self.pendiente = texto[corte:]
+            valores = valores[:-1]
+            texto = texto[:corte]
+        if quitado is not None:
+            self.quitar(quitado)
+        self.agregar_muchos(valores)
+        self.texto = texto
+
+    def moda(self):
+        if self.digest is not None:
+            return "N/D"
+        self._consolidar()
+        modas = self.por_frecuencia.get(self.max_freq, ())
+        return next(iter(modas)) if len(modas) == 1 else "Múltiple"
+
+    def cuantil(self, q):
+        """Cuantil q con interpolación lineal (tipo 7); del TDigest si es aproximado"""
+        if self.digest is not None:
+            return self.digest.cuantil(q)
+        self._consolidar()
+        h = (len(self.orden) - 1) * q
+        i = math.floor(h)
+        if i + 1 >= len(self.orden):
+            return self.orden[-1]
+        return self.orden[i] + (h - i) * (self.orden[i + 1] - self.orden[i])
+
+    def mediana(self):
+        return self.cuantil(0.5)
+
+    def percentil(self, p):
+        return self.cuantil(p / 100)
+
+    def _histograma_vacio(self, regla, margen=0.0):
+        acumulador = self.acumulador
+        desv = acumulador.varianza_muestral ** 0.5
+        if self.digest is not None:
+            minimo, maximo = acumulador.minimo, acumulador.maximo
+        else:
+            # quitar() no corrige los extremos del acumulador; el orden sí
+            self._consolidar()
+            minimo, maximo = self.orden[0], self.orden[-1]
+        return HistogramaFijo.con_regla(
+            regla, acumulador.n, minimo, maximo,
+            desv=desv, iqr=self.cuantil(0.75) - self.cuantil(0.25), margen=margen
+        )
+
+    def histograma(self, regla="sturges"):
+        """Histograma de la regla: O(k log n) con bisect sobre los bloques ordenados
+
+        En modo aproximado devuelve el histograma de bordes fijos que se
+        viene llenando con los bloques.
+        """
+        if self.digest is not None:
+            return self.histogramas[regla]
+        if not self.n:
+            return None
+        self._consolidar()
+        histograma = self._histograma_vacio(regla)
+        for bloque in self.orden.bloques():
+            histograma.agregar_ordenado(bloque)
+        return histograma
+
+    def resultados(self):
+        """Mismo diccionario que calcula la Calculadora"""
+        if not self.n:
+            return {}
+        acumulador = self.acumulador
+        if self.digest is not None:
+            # Recalculados al pasar a modo aproximado; desde ahí no se quitan valores
+            minimo, maximo = acumulador.minimo, acumulador.maximo
+        else:
+            self._consolidar()
+            minimo, maximo = self.orden[0], self.orden[-1]
+        q1, q3 = self.cuantil(0.25), self.cuantil(0.75)
+        return {
+            "aproximado": self.aproximado,
+            "n": acumulador.n,
+            "suma": acumulador.total,
+            "media": acumulador.media,
+            "mediana": self.mediana(),
+            "moda": self.moda(),
+            "min": minimo,
+            "max": maximo,
+            "rango": maximo - minimo,
+            "varianza": acumulador.varianza,
+            "desv_std": acumulador.varianza ** 0.5,
+            "varianza_m": acumulador.varianza_muestral,
+            "desv_std_m": acumulador.varianza_muestral ** 0.5,
+            "q1": q1,
+            "q3": q3,
+            "iqr": q3 - q1,
+            "asimetria": self._o_nd(acumulador.asimetria),
+            "curtosis": self._o_nd(acumulador.curtosis),
+            "cv": self._o_nd(acumulador.coef_variacion),
+            "error_estandar": self._o_nd(acumulador.error_estandar),
+        }
+
+    @staticmethod
+    def _o_nd(valor):
+        return "N/D" if valor is None else valor
+
+
+class ImportadorDatos:
+    """Lee los números de un archivo CSV/TXT por bloques de bytes
+
+    Cada lectura de `tam_lectura` bytes se convierte en un array('d'); el
+    último número, que puede quedar cortado, pasa a la lectura siguiente.
+    Separadores: coma, punto y coma, tabulador, espacio y saltos de línea.
+    Los textos que no son números (p. ej. encabezados) se cuentan en
+    `ignorados`. El archivo completo nunca está en memoria como texto.
+    """
+    TAM_LECTURA = 1 << 20
+    _SEPARADORES = bytes.maketrans(b",;\t\r\n", b"     ")
+
+    def __init__(self, ruta, tam_lectura=None):
+        self.ruta = ruta
+        self.tam_lectura = tam_lectura or ImportadorDatos.TAM_LECTURA
+        self.total_bytes = os.path.getsize(ruta)
+        self.leidos = 0
+        self.ignorados = 0
+
+    @property
+    def progreso(self):
+        return self.leidos / self.total_bytes if self.total_bytes else 1.0
+
+    def _convertir(self, tokens):
+        try:
+            return array('d', map(float, tokens))
+        except ValueError:
+            res = array('d')
+            for token in tokens:
+                try:
+                    res.append(float(token))
+                except ValueError:
+                    self.ignorados += 1
+            return res
+
+    def bloques(self, cancelado=None):
+        """Itera array('d') por lectura; se detiene si `cancelado` (Event) se activa"""
+        resto = b""
+        with open(self.ruta, "rb") as archivo:
+            while cancelado is None or not cancelado.is_set():
+                trozo = archivo.read(self.tam_lectura)
+                if not trozo:
+                    if resto.strip():
+                        yield self._convertir(resto.split())
+                    return
+                self.leidos += len(trozo)
+                datos = (resto + trozo).translate(ImportadorDatos._SEPARADORES)
+                corte = datos.rfind(b" ")
+                if corte < 0:
+                    resto = datos
+                    continue
+                resto = datos[corte + 1:]
+                yield self._convertir(datos[:corte].split())
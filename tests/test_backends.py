@@ -0,0 +1,131 @@
+"""El backend puro y el de NumPy deben dar los mismos resultados
+
+Uso: python -m unittest discover -s tests   (desde la raíz del proyecto)
+Sin NumPy instalado las pruebas se omiten.
+"""
+import math
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from statistics_logic import BackendNumPy, BackendPuro, EstadisticaPura, np  # noqa: E402
+
+# Valores centrales, colas lejanas y bordes del soporte
+XS = [-40.0, -20.0, -10.0, -8.0, -5.0, -2.5, -1.0, -1e-8, 0.0, 1e-8, 0.5, 1.0, 2.5, 5.0, 8.0, 10.0, 20.0, 40.0]
+XS_POSITIVOS = [0.0, 1e-10, 1e-4, 0.01, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 80.0, 200.0]
+PS = [0.0, 1e-300, 1e-15, 1e-9, 1e-4, 0.001, 0.01, 0.025, 0.1, 0.3, 0.5, 0.7, 0.9, 0.975, 0.99, 0.999,
+      1 - 1e-9, 1.0]
+# En la t el cuantil de p < 1e-100 desborda t² al evaluar la CDF
+PS_T = [1e-100, 1e-60, 1e-30] + PS[2:]
+KS = list(range(-2, 60))
+
+
+class TestBackendsCoinciden(unittest.TestCase):
+    """Cada método *_many del backend puro contra el mismo método en NumPy"""
+
+    RTOL = 1e-9
+    ATOL = 1e-300
+
+    @classmethod
+    def setUpClass(cls):
+        if np is None:
+            raise unittest.SkipTest("NumPy no está instalado")
+
+    def comparar(self, metodo, *args, rtol=None):
+        rtol = self.RTOL if rtol is None else rtol
+        puro = list(getattr(BackendPuro, metodo)(*args))
+        rapido = [float(v) for v in getattr(BackendNumPy, metodo)(*args)]
+        self.assertEqual(len(puro), len(rapido), metodo)
+        for i, (a, b) in enumerate(zip(puro, rapido)):
+            if math.isinf(a) or math.isinf(b):
+                self.assertEqual(a, b, f"{metodo}{args[1:]} en {args[0][i]!r}")
+                continue
+            self.assertLessEqual(abs(a - b), rtol * max(abs(a), abs(b)) + self.ATOL,
+                                 f"{metodo}{args[1:]} en {args[0][i]!r}: {a!r} vs {b!r}")
+
+    def test_normal(self):
+        for mu, sigma in ((0, 1), (3, 0.5), (-10, 4)):
+            self.comparar("normal_pdf_many", XS, mu, sigma)
+            self.comparar("normal_cdf_many", XS, mu, sigma)
+            self.comparar("normal_ppf_many", PS, mu, sigma)
+
+    def test_normal_cola_izquierda(self):
+        # 0.5·(1 + erf(z)) se cancela a 0 aquí; los dos deben conservar la cola
+        for x in (-10.0, -20.0, -37.0):
+            puro = BackendPuro.normal_cdf_many([x])[0]
+            self.assertGreater(puro, 0.0)
+            self.assertAlmostEqual(puro / EstadisticaPura.normal_cdf(x), 1.0, places=12)
+
+    def test_t(self):
+        for df in (1, 2, 3, 5, 10, 30, 100, 1000):
+            self.comparar("t_pdf_many", XS, df)
+            self.comparar("t_cdf_many", XS, df)
+            self.comparar("t_ppf_many", PS_T, df)
+
+    def test_t_ppf_gl_por_elemento(self):
+        dfs = [1, 2, 3, 7, 30, 250, 1000] * 3
+        ps = [0.0005, 0.05, 0.3, 0.5, 0.8, 0.975, 0.9995] * 3
+        self.comparar("t_ppf_many", ps, dfs)
+
+    def test_chi2(self):
+        for k in (1, 2, 3, 10, 50, 100):
+            self.comparar("chi2_pdf_many", XS_POSITIVOS, k)
+            self.comparar("chi2_cdf_many", XS_POSITIVOS, k)
+            self.comparar("chi2_ppf_many", PS[1:-1], k)
+
+    def test_f(self):
+        for df1, df2 in ((1, 1), (2, 5), (5, 12), (10, 30), (30, 120)):
+            self.comparar("f_pdf_many", XS_POSITIVOS, df1, df2)
+            self.comparar("f_cdf_many", XS_POSITIVOS, df1, df2)
+            self.comparar("f_ppf_many", PS[3:-1], df1, df2)
+
+    def test_exponencial(self):
+        for lambd in (0.1, 1.0, 7.5):
+            self.comparar("exponential_pdf_many", XS, lambd)
+            self.comparar("exponential_cdf_many", XS, lambd)
+
+    def test_discretas(self):
+        for n, p in ((1, 0.5), (10, 0.3), (50, 0.01), (50, 0.99), (20, 0.0), (20, 1.0)):
+            self.comparar("binomial_pmf_many", KS, n, p)
+        for lambd in (0.0, 0.5, 4.0, 40.0):
+            self.comparar("poisson_pmf_many", KS, lambd)
+
+
+class TestMuestreadores(unittest.TestCase):
+    """Los muestreadores de ambos backends deben tener los mismos momentos"""
+
+    N = 200_000
+
+    @classmethod
+    def setUpClass(cls):
+        if np is None:
+            raise unittest.SkipTest("NumPy no está instalado")
+
+    def momentos(self, backend, dist_id, params):
+        valores = list(backend.muestreador(dist_id, params, backend.generador(12345))(self.N))
+        media = math.fsum(valores) / len(valores)
+        varianza = math.fsum((v - media) ** 2 for v in valores) / (len(valores) - 1)
+        return media, varianza
+
+    def test_momentos(self):
+        casos = {
+            "normal": ([2.0, 3.0], 2.0, 9.0),
+            "exponencial": ([0.5], 2.0, 4.0),
+            "uniforme": ([-1.0, 3.0], 1.0, 16 / 12),
+            "poisson": ([30.0], 30.0, 30.0),
+            "binomial": ([40, 0.3], 12.0, 8.4),
+            "t_student": ([10], 0.0, 10 / 8),
+            "chi_cuadrado": ([6], 6.0, 12.0),
+        }
+        for dist_id, (params, media, varianza) in casos.items():
+            for backend in (BackendPuro, BackendNumPy):
+                m, v = self.momentos(backend, dist_id, params)
+                error = 6 * math.sqrt(varianza / self.N)
+                self.assertLess(abs(m - media), error, f"{backend.nombre} {dist_id}: media {m}")
+                self.assertLess(abs(v / varianza - 1), 0.05, f"{backend.nombre} {dist_id}: varianza {v}")
+
+
+if __name__ == "__main__":
+    unittest.main()